@@ -0,0 +1,77 @@
+"""
+Expire the session under N concurrent device refreshes and count logins.
+
+Every in-flight CheckDataSession gets a 401 at the same time; with the
+single-flight login gate the client should log in exactly once and replay.
+
+Usage: python benchmarks/bench_auth_storm.py [--requests 50]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import pathlib
+import sys
+import time
+
+import aiohttp
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "my_honeywell"))
+
+from aiosomecomfort import AIOSomeComfort  # noqa: E402
+
+from fake_tcc import FakeTCCServer  # noqa: E402
+
+
+async def main(requests: int) -> None:
+    """Run one 401 storm and report logins, requests and duration."""
+    server = FakeTCCServer(devices=requests, latency=0.05)
+    await server.start()
+    try:
+        async with aiohttp.ClientSession(
+            cookie_jar=aiohttp.CookieJar(unsafe=True)
+        ) as session:
+            # Limit lifted so every refresh hits the expired session at once
+            client = AIOSomeComfort(
+                "bench",
+                "bench",
+                session=session,
+                request_rate=1e6,
+                request_burst=1_000_000,
+                baseurl=server.url,
+            )
+            await client.login()
+            await client.discover()
+            devices = [
+                device
+                for location in client.locations_by_id.values()
+                for device in location.devices_by_id.values()
+            ]
+
+            server.expire_sessions()
+            server.logins = 0
+            server.requests = 0
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(device.refresh() for device in devices), return_exceptions=True
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        await server.stop()
+
+    failures = sum(1 for result in results if isinstance(result, BaseException))
+    print(f"concurrent 401s: {requests}")
+    print(f"logins:          {server.logins}")
+    print(f"requests:        {server.requests}")
+    print(f"failures:        {failures}")
+    print(f"duration:        {elapsed:.2f}s")
+    if server.logins != 1 or failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.ERROR)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=50)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,112 @@
+"""
+Count TCP connections opened across refresh cycles with two connectors.
+
+"default" is a plain aiohttp connector (15s keep-alive), as each entry used
+to get. "tuned" uses the integration's shared-connector settings, whose
+keep-alive outlasts the gap between cycles. The gap defaults to 20s, so the
+default connector has to reconnect for every cycle.
+
+Usage: python benchmarks/bench_connections.py [--devices 10] [--cycles 3] [--gap 20]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "my_honeywell"))
+
+import aiohttp  # noqa: E402
+
+from aiosomecomfort import AIOSomeComfort  # noqa: E402
+from const import (  # noqa: E402
+    CONNECTOR_DNS_CACHE_TTL,
+    CONNECTOR_KEEPALIVE_TIMEOUT,
+    CONNECTOR_LIMIT_PER_HOST,
+    DEFAULT_MAX_CONCURRENT_REFRESHES,
+)
+
+from fake_tcc import FakeTCCServer  # noqa: E402
+
+
+def make_connector(tuned: bool) -> aiohttp.TCPConnector:
+    """Return the old default connector or the integration's tuned one."""
+    if not tuned:
+        return aiohttp.TCPConnector()
+    return aiohttp.TCPConnector(
+        limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+        ttl_dns_cache=CONNECTOR_DNS_CACHE_TTL,
+        keepalive_timeout=CONNECTOR_KEEPALIVE_TIMEOUT,
+    )
+
+
+async def run(
+    tuned: bool, devices: int, cycles: int, gap: float, latency: float
+) -> tuple[int, int, list[float]]:
+    """Return connections opened, requests and per-cycle seconds."""
+    server = FakeTCCServer(devices=devices, latency=latency)
+    await server.start()
+    durations = []
+    try:
+        async with aiohttp.ClientSession(
+            connector=make_connector(tuned),
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
+        ) as session:
+            client = AIOSomeComfort(
+                "bench",
+                "bench",
+                session=session,
+                request_rate=1e6,
+                request_burst=1_000_000,
+                baseurl=server.url,
+            )
+            await client.login()
+            await client.discover()
+            fleet = [
+                device
+                for location in client.locations_by_id.values()
+                for device in location.devices_by_id.values()
+            ]
+            semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_REFRESHES)
+
+            async def refresh(device) -> None:
+                async with semaphore:
+                    await device.refresh()
+
+            server.peers.clear()
+            server.requests = 0
+            for cycle in range(cycles):
+                if cycle:
+                    await asyncio.sleep(gap)
+                start = time.perf_counter()
+                await asyncio.gather(*(refresh(device) for device in fleet))
+                durations.append(time.perf_counter() - start)
+            return len(server.peers), server.requests, durations
+    finally:
+        await server.stop()
+
+
+async def main(devices: int, cycles: int, gap: float, latency: float) -> None:
+    """Print connections and cycle times for both connectors."""
+    print(f"devices={devices} cycles={cycles} gap={gap}s latency={latency * 1000:.0f}ms")
+    print(f"{'connector':<10} {'connections':>11} {'requests':>9}  cycle s")
+    for name, tuned in (("default", False), ("tuned", True)):
+        connections, requests, durations = await run(
+            tuned, devices, cycles, gap, latency
+        )
+        cycle_times = " ".join(f"{duration:.3f}" for duration in durations)
+        print(f"{name:<10} {connections:>11} {requests:>9}  {cycle_times}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.ERROR)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--gap", type=float, default=20)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.devices, args.cycles, args.gap, args.latency))
@@ -0,0 +1,180 @@
+"""
+Compare Device property reads from the parsed DeviceState with dict lookups.
+
+The "dict" rows use a Device subclass with the old properties, which walked
+_data["uiData"] on every access. The read set is roughly what a climate
+entity reads during one state write. Memory is measured with tracemalloc per
+device, for the raw latestData payload and for the parsed state added on top.
+
+Usage: python benchmarks/bench_device_props.py [--devices 1000] [--rounds 200]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "my_honeywell"))
+
+from aiosomecomfort.device import (  # noqa: E402
+    EQUIPMENT_OUTPUT_STATUS,
+    FAN_MODES,
+    HOLD_TYPES,
+    SYSTEM_MODES,
+    Device,
+    DeviceState,
+    _hold_deadline,
+)
+
+from fake_tcc import make_device  # noqa: E402
+
+
+class DictDevice(Device):
+    """Device with the old property implementations, reading _data each time."""
+
+    @property
+    def fan_running(self) -> bool:
+        if self._data.get("hasFan"):
+            return self._data["fanData"]["fanIsRunning"]
+        return False
+
+    @property
+    def fan_mode(self) -> str | None:
+        return FAN_MODES[self._data["fanData"]["fanMode"]]
+
+    @property
+    def system_mode(self) -> str:
+        return SYSTEM_MODES[self._data["uiData"]["SystemSwitchPosition"]]
+
+    @property
+    def setpoint_cool(self) -> float:
+        return self._data["uiData"]["CoolSetpoint"]
+
+    @property
+    def setpoint_heat(self) -> float:
+        return self._data["uiData"]["HeatSetpoint"]
+
+    def _get_hold(self, which):
+        hold = HOLD_TYPES[self._data["uiData"][f"Status{which}"]]
+        period = self._data["uiData"][f"{which}NextPeriod"]
+        if hold == "schedule":
+            return False
+        if hold == "permanent":
+            return True
+        return _hold_deadline(period)
+
+    @property
+    def current_temperature(self) -> float:
+        return self._data["uiData"]["DispTemperature"]
+
+    @property
+    def current_humidity(self) -> float | None:
+        return (
+            self._data["uiData"]["IndoorHumidity"]
+            if self._data["uiData"]["IndoorHumiditySensorAvailable"]
+            and self._data["uiData"]["IndoorHumiditySensorNotFault"]
+            else None
+        )
+
+    @property
+    def equipment_output_status(self) -> str:
+        if self._data["uiData"]["EquipmentOutputStatus"] in (0, None):
+            if self.fan_running:
+                return "fan"
+            return "off"
+        return EQUIPMENT_OUTPUT_STATUS[self._data["uiData"]["EquipmentOutputStatus"]]
+
+    @property
+    def outdoor_temperature(self) -> float | None:
+        if self._data["uiData"]["OutdoorTemperatureAvailable"]:
+            return self._data["uiData"]["OutdoorTemperature"]
+        return None
+
+    @property
+    def temperature_unit(self) -> str:
+        return self._data["uiData"]["DisplayUnits"]
+
+
+def read(device: Device) -> tuple:
+    """The properties a climate entity reads during one state write."""
+    return (
+        device.current_temperature,
+        device.setpoint_heat,
+        device.setpoint_cool,
+        device.system_mode,
+        device.fan_mode,
+        device.equipment_output_status,
+        device.current_humidity,
+        device.outdoor_temperature,
+        device.hold_heat,
+        device.temperature_unit,
+    )
+
+
+def per_device_bytes(build, count: int) -> float:
+    """Average bytes allocated by build() over count calls."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def main(devices: int, rounds: int) -> None:
+    """Print per-read cost and per-device memory for both paths."""
+    payloads = [
+        json.loads(json.dumps(make_device(1000 + index)["latestData"]))
+        for index in range(devices)
+    ]
+    fleets = {"dict": [], "state": []}
+    for index, payload in enumerate(payloads):
+        for name, cls in (("dict", DictDevice), ("state", Device)):
+            device = cls(None, None)
+            device._deviceid = 1000 + index
+            device._data = payload
+            device._state = DeviceState.from_data(payload)
+            fleets[name].append(device)
+    assert read(fleets["dict"][0]) == read(fleets["state"][0])
+
+    reads = devices * rounds
+    read_ns = {}
+    for name, fleet in fleets.items():
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for device in fleet:
+                read(device)
+        read_ns[name] = (time.perf_counter() - start) / reads * 1e9
+
+    start = time.perf_counter()
+    for payload in payloads:
+        DeviceState.from_data(payload)
+    parse_us = (time.perf_counter() - start) / devices * 1e6
+
+    payload_bytes = per_device_bytes(
+        lambda index: json.loads(json.dumps(make_device(index)["latestData"])),
+        devices,
+    )
+    state_bytes = per_device_bytes(
+        lambda index: DeviceState.from_data(payloads[index]), devices
+    )
+
+    print(f"devices={devices} rounds={rounds}")
+    print(f"{'path':<8} {'ns/entity read':>15}")
+    for name, nanoseconds in read_ns.items():
+        print(f"{name:<8} {nanoseconds:>15.0f}")
+    print(f"parse per refresh:   {parse_us:.1f}us")
+    print(f"latestData/device:   {payload_bytes:.0f} bytes")
+    print(f"DeviceState/device: +{state_bytes:.0f} bytes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    main(args.devices, args.rounds)
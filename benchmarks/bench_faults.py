@@ -0,0 +1,240 @@
+"""
+Measure how the client and the coordinator ride out faults from the fake TCC server.
+
+For each fault profile (see fake_tcc.PROFILES) a fresh fake account is
+polled until it is healthy, the profile is injected for its duration, and
+polling continues until every device has refreshed successfully again.
+
+Two pollers are measured:
+- client: every --interval seconds, refresh all devices concurrently, so
+  _request_json_with_retry's retries and re-logins decide the outcome
+- coordinator: MyHoneywellCoordinator cycles at its own update interval,
+  with the poll scheduler, breaker handling and error counting in play
+  (needs Home Assistant installed)
+
+Reported per profile and poller: time to recover after the fault ended
+(">N" if not recovered within --max-wait), polls that failed, requests and
+logins sent from injection to recovery, and responses the fault changed.
+With --csv, rows are also appended to a CSV file so runs can be compared
+over time.
+
+Usage: python benchmarks/bench_faults.py [--devices 10] [--profiles 503-burst,401-storm]
+       [--poller client|coordinator|both] [--max-wait 60] [--csv results.csv]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import datetime
+import logging
+import pathlib
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+
+import aiohttp
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "my_honeywell"))
+
+from aiosomecomfort import AIOSomeComfort  # noqa: E402
+from aiosomecomfort.exceptions import SomeComfortError  # noqa: E402
+
+from fake_tcc import PROFILES, FakeTCCServer, FaultProfile  # noqa: E402
+
+
+@dataclass
+class Result:
+    """Outcome of one profile against one poller."""
+
+    profile: str
+    poller: str
+    fault_s: float
+    recover_s: float | None
+    failed_polls: int
+    polls: int
+    requests: int
+    logins: int
+    fault_responses: int
+
+
+async def poll_client(client: AIOSomeComfort, devices: list) -> bool:
+    """Refresh every device at once; True if all succeeded."""
+    results = await asyncio.gather(
+        *(device.refresh() for device in devices), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, SomeComfortError):
+            raise result
+    return not any(results)
+
+
+def make_coordinator_poller(hass, client: AIOSomeComfort, name: str):
+    """Return a poll function running one coordinator cycle, and its interval."""
+    from harness import make_coordinator
+    from homeassistant.helpers.update_coordinator import UpdateFailed
+
+    coordinator = make_coordinator(hass, client, name)
+
+    async def poll(client: AIOSomeComfort, devices: list) -> bool:
+        try:
+            data = await coordinator._async_update_data()
+        except UpdateFailed:
+            return False
+        return all(data[device.deviceid]["available"] for device in devices)
+
+    return poll, coordinator.update_interval.total_seconds()
+
+
+async def run_profile(
+    profile: FaultProfile,
+    poller: str,
+    devices: int,
+    interval: float,
+    max_wait: float,
+    hass=None,
+) -> Result:
+    """Inject one profile and poll until every device has refreshed since it ended."""
+    server = FakeTCCServer(devices=devices, latency=0.01, seed=1)
+    await server.start()
+    try:
+        async with aiohttp.ClientSession(
+            cookie_jar=aiohttp.CookieJar(unsafe=True)
+        ) as session:
+            if poller == "coordinator":
+                # The coordinator catches the package's own exception classes
+                from harness import make_client
+
+                client = make_client(session, server.url)
+            else:
+                client = AIOSomeComfort(
+                    "bench",
+                    "bench",
+                    session=session,
+                    request_rate=1e6,
+                    request_burst=1_000_000,
+                    baseurl=server.url,
+                )
+            await client.login()
+            await client.discover()
+            all_devices = [
+                device
+                for location in client.locations_by_id.values()
+                for device in location.devices_by_id.values()
+            ]
+            poll = poll_client
+            if poller == "coordinator":
+                poll, interval = make_coordinator_poller(
+                    hass, client, f"faults-{profile.name}"
+                )
+                await poll(client, all_devices)
+
+            requests, logins = server.requests, server.logins
+            server.inject(profile)
+            fault_ends = time.monotonic() + profile.duration
+            fault_ends_wall = time.time() + profile.duration
+            polls = failed = 0
+            recover_s = None
+            while True:
+                started = time.monotonic()
+                polls += 1
+                if not await poll(client, all_devices):
+                    failed += 1
+                now = time.monotonic()
+                if now >= fault_ends and all(
+                    device._last_refresh >= fault_ends_wall for device in all_devices
+                ):
+                    recover_s = round(now - fault_ends, 3)
+                    break
+                if now - fault_ends > max_wait:
+                    break
+                await asyncio.sleep(max(0.0, interval - (now - started)))
+
+            return Result(
+                profile=profile.name,
+                poller=poller,
+                fault_s=profile.duration,
+                recover_s=recover_s,
+                failed_polls=failed,
+                polls=polls,
+                requests=server.requests - requests,
+                logins=server.logins - logins,
+                fault_responses=server.fault_responses,
+            )
+    finally:
+        await server.stop()
+
+
+def print_table(results: list[Result], max_wait: float) -> None:
+    """Print results as a fixed-width table."""
+    print(
+        f"{'profile':<12} {'poller':<12} {'fault s':>7} {'recover s':>9} "
+        f"{'failed':>9} {'requests':>8} {'logins':>6} {'faulted':>7}"
+    )
+    for result in results:
+        recover = (
+            f"{result.recover_s:.1f}" if result.recover_s is not None else f">{max_wait:.0f}"
+        )
+        print(
+            f"{result.profile:<12} {result.poller:<12} {result.fault_s:>7.0f} "
+            f"{recover:>9} {f'{result.failed_polls}/{result.polls}':>9} "
+            f"{result.requests:>8} {result.logins:>6} {result.fault_responses:>7}"
+        )
+
+
+def append_csv(path: str, results: list[Result]) -> None:
+    """Append results to a CSV file, writing the header for a new file."""
+    run_at = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+    new = not pathlib.Path(path).exists()
+    with open(path, "a", newline="") as file:
+        writer = csv.DictWriter(file, ["run_at", *Result.__dataclass_fields__])
+        if new:
+            writer.writeheader()
+        for result in results:
+            writer.writerow({"run_at": run_at, **asdict(result)})
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run every selected profile against every selected poller."""
+    pollers = ("client", "coordinator") if args.poller == "both" else (args.poller,)
+    profiles = [PROFILES[name] for name in args.profiles.split(",")]
+    hass = None
+    config_dir = tempfile.TemporaryDirectory()
+    if "coordinator" in pollers:
+        from harness import HomeAssistant
+
+        hass = HomeAssistant(config_dir.name)
+
+    results = []
+    for poller in pollers:
+        for profile in profiles:
+            results.append(
+                await run_profile(
+                    profile, poller, args.devices, args.interval, args.max_wait, hass
+                )
+            )
+    if hass is not None:
+        await hass.async_stop(force=True)
+    config_dir.cleanup()
+
+    print(f"devices={args.devices} interval={args.interval}s max_wait={args.max_wait}s")
+    print_table(results, args.max_wait)
+    if args.csv:
+        append_csv(args.csv, results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--profiles", default=",".join(PROFILES))
+    parser.add_argument(
+        "--poller", choices=("client", "coordinator", "both"), default="both"
+    )
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--max-wait", type=float, default=60.0)
+    parser.add_argument("--csv")
+    args = parser.parse_args()
+    # Retries and re-logins log a warning each; keep the table readable
+    logging.getLogger("somecomfort").setLevel(logging.CRITICAL)
+    asyncio.run(main(args))
@@ -0,0 +1,74 @@
+"""
+Count and time location-list page requests for different account sizes.
+
+Usage: python benchmarks/bench_locations.py [--latency 0.1] [--page-size 10]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "my_honeywell"))
+
+import aiohttp  # noqa: E402
+
+from aiosomecomfort import AIOSomeComfort  # noqa: E402
+
+from fake_tcc import FakeTCCServer  # noqa: E402
+
+
+async def list_locations(
+    locations: int, page_size: int, concurrency: int, latency: float
+) -> tuple[int, int, float]:
+    """Return locations found, page requests and seconds for one listing."""
+    server = FakeTCCServer(
+        devices=locations, locations=locations, page_size=page_size, latency=latency
+    )
+    await server.start()
+    try:
+        async with aiohttp.ClientSession(
+            cookie_jar=aiohttp.CookieJar(unsafe=True)
+        ) as session:
+            client = AIOSomeComfort(
+                "bench",
+                "bench",
+                session=session,
+                location_page_concurrency=concurrency,
+                request_rate=1e6,
+                request_burst=1_000_000,
+                baseurl=server.url,
+            )
+            await client.login()
+            start = time.perf_counter()
+            found = await client._get_locations() or []
+            elapsed = time.perf_counter() - start
+            return len(found), client.location_page_requests, elapsed
+    finally:
+        await server.stop()
+
+
+async def main(latency: float, page_size: int) -> None:
+    """Print a table over account sizes and page concurrency."""
+    print(f"latency={latency * 1000:.0f}ms page_size={page_size}")
+    print(f"{'locations':>9} {'conc':>5} {'found':>6} {'pages':>6} {'seconds':>8}")
+    for locations in (1, 9, 10, 35, 120):
+        for concurrency in (1, 4):
+            found, pages, elapsed = await list_locations(
+                locations, page_size, concurrency, latency
+            )
+            print(
+                f"{locations:>9} {concurrency:>5} {found:>6} {pages:>6} {elapsed:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.ERROR)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--page-size", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.latency, args.page_size))
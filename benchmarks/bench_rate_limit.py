@@ -0,0 +1,74 @@
+"""
+Show how long a user write waits behind a burst of polls at the rate limit.
+
+Runs on a virtual clock, so it finishes instantly whatever the rate: N polls
+queue at t=0, then one write arrives a little later. With priorities the
+write takes the next token; "fifo" queues it at poll priority instead.
+
+Usage: python benchmarks/bench_rate_limit.py [--polls 100] [--rate 5] [--burst 10]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "my_honeywell"))
+
+from aiosomecomfort.ratelimit import (  # noqa: E402
+    PRIORITY_POLL,
+    PRIORITY_WRITE,
+    TokenBucket,
+)
+
+
+class VirtualClock:
+    """A clock that only moves when something sleeps on it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+async def run(polls: int, rate: float, burst: int, write_priority: int) -> tuple[float, dict]:
+    """Return the write's wait and the limiter stats for one scenario."""
+    clock = VirtualClock()
+    bucket = TokenBucket(rate, burst, clock=clock, sleep=clock.sleep)
+    poll_tasks = [
+        asyncio.ensure_future(bucket.acquire(PRIORITY_POLL)) for _ in range(polls)
+    ]
+    # Let the polls queue and the pump start before the write shows up
+    while clock.now < 1 / rate:
+        await asyncio.sleep(0)
+    write_wait = await bucket.acquire(write_priority)
+    await asyncio.gather(*poll_tasks)
+    return write_wait, bucket.stats()
+
+
+async def main(polls: int, rate: float, burst: int) -> None:
+    """Print write wait and queue metrics with and without priorities."""
+    print(f"polls={polls} rate={rate}/s burst={burst}")
+    print(f"{'queue':<9} {'write wait s':>12} {'max depth':>10} {'mean wait s':>12} {'max wait s':>11}")
+    for name, priority in (("priority", PRIORITY_WRITE), ("fifo", PRIORITY_POLL)):
+        write_wait, stats = await run(polls, rate, burst, priority)
+        mean = stats["total_wait"] / stats["waited"] if stats["waited"] else 0
+        print(
+            f"{name:<9} {write_wait:>12.2f} {stats['max_queue_depth']:>10} "
+            f"{mean:>12.2f} {stats['max_wait']:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--polls", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=5)
+    parser.add_argument("--burst", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.polls, args.rate, args.burst))
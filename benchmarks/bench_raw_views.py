@@ -0,0 +1,117 @@
+"""
+Compare the Device.raw_* read-only views with the old deepcopy per access.
+
+Each "read" touches raw_ui_data, raw_fan_data, raw_dr_data and raw_data
+once, as a diagnostics dump or template sweep over a fleet would. The
+payloads are the fake server's thermostat plus a Menu/GetData body with
+humidifier and dehumidifier sections.
+
+Usage: python benchmarks/bench_raw_views.py [--devices 500] [--reads 20]
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "my_honeywell"))
+
+from aiosomecomfort.device import Device, DeviceState  # noqa: E402
+
+from fake_tcc import make_device  # noqa: E402
+
+GDATA = {
+    "Humidifier": {
+        "Setpoint": 35, "Mode": 1, "LowerLimit": 10, "UpperLimit": 60,
+        "DeviceId": 0, "CanControl": True, "Options": [0, 1, 2],
+    },
+    "Dehumidifier": {
+        "Setpoint": 55, "Mode": 0, "LowerLimit": 40, "UpperLimit": 80,
+        "DeviceId": 0, "CanControl": True, "Options": [0, 1],
+    },
+    "Ventilation": None,
+}
+
+
+def deepcopy_read(device: Device) -> tuple:
+    """The old raw_* properties."""
+    return (
+        copy.deepcopy(device._data["uiData"]),
+        copy.deepcopy(device._data["fanData"]),
+        copy.deepcopy(device._data["drData"]),
+        copy.deepcopy(device._gdata),
+    )
+
+
+def view_read(device: Device) -> tuple:
+    """The raw_* properties as they are now."""
+    return (
+        device.raw_ui_data,
+        device.raw_fan_data,
+        device.raw_dr_data,
+        device.raw_data,
+    )
+
+
+def make_fleet(devices: int) -> list[Device]:
+    """Build devices as if each had just been refreshed."""
+    fleet = []
+    for index in range(devices):
+        device = Device(None, None)
+        device._deviceid = 1000 + index
+        device._data = json.loads(json.dumps(make_device(1000 + index)["latestData"]))
+        device._gdata = json.loads(json.dumps(GDATA))
+        device._state = DeviceState.from_data(device._data)
+        fleet.append(device)
+    return fleet
+
+
+def measure(read, fleet: list[Device], reads: int) -> tuple[float, float]:
+    """Return microseconds per device read and bytes held per read result.
+
+    Memory is taken on the first pass over the fleet, so for the views it
+    includes building them.
+    """
+    tracemalloc.start()
+    results = [read(device) for device in fleet]
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+
+    start = time.perf_counter()
+    for _ in range(reads):
+        for device in fleet:
+            read(device)
+    micros = (time.perf_counter() - start) / (reads * len(fleet)) * 1e6
+    return micros, held / len(fleet)
+
+
+def main(devices: int, reads: int) -> None:
+    """Print per-read cost for deepcopy and views, cold and warm."""
+    fleet = make_fleet(devices)
+    payload = len(json.dumps(fleet[0]._data)) + len(json.dumps(fleet[0]._gdata))
+    print(f"devices={devices} reads={reads} payload={payload} bytes JSON")
+    print(f"{'path':<14} {'us/read':>8} {'bytes/read':>11}")
+    micros, peak = measure(deepcopy_read, fleet, reads)
+    print(f"{'deepcopy':<14} {micros:>8.2f} {peak:>11.0f}")
+    # The first read after a refresh builds the views, later ones reuse them
+    cold = make_fleet(devices)
+    start = time.perf_counter()
+    for device in cold:
+        view_read(device)
+    first = (time.perf_counter() - start) / devices * 1e6
+    micros, peak = measure(view_read, fleet, reads)
+    print(f"{'view (first)':<14} {first:>8.2f} {peak:>11.0f}")
+    print(f"{'view (cached)':<14} {micros:>8.2f} {0:>11.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=20)
+    args = parser.parse_args()
+    main(args.devices, args.reads)
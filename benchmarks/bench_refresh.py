@@ -0,0 +1,73 @@
+"""
+Benchmark one coordinator refresh cycle against the fake TCC server.
+
+Each device refresh costs one CheckDataSession round trip with the injected
+latency, so a cycle should take roughly ceil(N / concurrency) * latency.
+
+Usage: python benchmarks/bench_refresh.py [--latency 0.2]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import tempfile
+import time
+
+from harness import HomeAssistant, make_client, make_coordinator, make_session
+
+from custom_components.my_honeywell.const import CONF_MAX_CONCURRENT_REFRESHES
+
+from fake_tcc import FakeTCCServer
+
+
+async def run_cycle(
+    hass: HomeAssistant, devices: int, concurrency: int, latency: float
+) -> tuple[float, int]:
+    """Discover N fake devices and time a single coordinator cycle."""
+    server = FakeTCCServer(devices=devices)
+    await server.start()
+    try:
+        async with make_session() as session:
+            client = make_client(session, server.url)
+            await client.login()
+            await client.discover()
+            coordinator = make_coordinator(
+                hass,
+                client,
+                f"bench-{devices}-{concurrency}",
+                {CONF_MAX_CONCURRENT_REFRESHES: concurrency},
+            )
+
+            server.latency = latency
+            server.requests = 0
+            start = time.perf_counter()
+            await coordinator._async_update_data()
+            return time.perf_counter() - start, server.requests
+    finally:
+        await server.stop()
+
+
+async def main(latency: float) -> None:
+    """Print cycle time for a grid of device counts and concurrency caps."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        print(f"latency={latency * 1000:.0f}ms")
+        print(f"{'devices':>8} {'conc':>5} {'cycle s':>8} {'expected s':>10} {'requests':>9}")
+        for devices in (10, 40, 80):
+            for concurrency in (1, 4, 8, 16):
+                elapsed, requests = await run_cycle(
+                    hass, devices, concurrency, latency
+                )
+                expected = math.ceil(devices / concurrency) * latency
+                print(
+                    f"{devices:>8} {concurrency:>5} {elapsed:>8.2f} "
+                    f"{expected:>10.2f} {requests:>9}"
+                )
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.2)
+    asyncio.run(main(parser.parse_args().latency))
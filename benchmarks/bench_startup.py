@@ -0,0 +1,97 @@
+"""
+Compare time-to-entities for a cold start and a snapshot start.
+
+Cold start is login, discovery and the coordinator's first refresh, all
+blocking. The "hydrating" variant is the old discovery that refreshed every
+device itself before the first refresh repeated it; "lazy" discovers from
+the location list only and lets the first refresh load the data. Snapshot
+start restores the saved session and device snapshot, serves it as stale
+data, and revalidates in the background.
+
+Usage: python benchmarks/bench_startup.py [--devices 50] [--latency 0.1]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+
+from harness import HomeAssistant, make_client, make_coordinator, make_session
+
+from fake_tcc import FakeTCCServer
+
+
+async def cold_start(
+    hass: HomeAssistant, server: FakeTCCServer, hydrate: bool
+) -> tuple[float, dict, list]:
+    """Blocking login, discovery and first refresh; return time and snapshot."""
+    async with make_session() as session:
+        client = make_client(session, server.url)
+        start = time.perf_counter()
+        await client.ensure_authenticated()
+        await client.discover(hydrate=hydrate)
+        coordinator = make_coordinator(hass, client, f"cold-{hydrate}")
+        await coordinator._async_update_data()
+        elapsed = time.perf_counter() - start
+        return elapsed, client.export_session(), json.loads(json.dumps(client.snapshot()))
+
+
+async def snapshot_start(
+    hass: HomeAssistant, server: FakeTCCServer, saved_session: dict, snapshot: list
+) -> tuple[float, float]:
+    """Restore from snapshot; return time to entities and to revalidated data."""
+    async with make_session() as session:
+        client = make_client(session, server.url)
+        start = time.perf_counter()
+        client.restore_session(**saved_session)
+        client.restore_snapshot(snapshot)
+        coordinator = make_coordinator(hass, client, "warm")
+        coordinator.async_set_stale_data()
+        ready = time.perf_counter() - start
+        coordinator.data = await coordinator._async_update_data()
+        await client.get_device_ids()
+        return ready, time.perf_counter() - start
+
+
+async def main(devices: int, latency: float) -> None:
+    """Run both startup paths against the same fake account."""
+    server = FakeTCCServer(devices=devices, latency=latency)
+    await server.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            server.requests = 0
+            hydrating, _, _ = await cold_start(hass, server, hydrate=True)
+            hydrating_requests = server.requests
+
+            server.requests = 0
+            cold, saved_session, snapshot = await cold_start(hass, server, hydrate=False)
+            cold_requests = server.requests
+
+            server.requests = 0
+            ready, revalidated = await snapshot_start(
+                hass, server, saved_session, snapshot
+            )
+            warm_requests = server.requests
+        finally:
+            await server.stop()
+            await hass.async_stop(force=True)
+
+    print(f"devices={devices} latency={latency * 1000:.0f}ms")
+    print(f"{'path':<16} {'entities s':>10} {'fresh data s':>12} {'requests':>9}")
+    print(
+        f"{'cold hydrating':<16} {hydrating:>10.3f} {hydrating:>12.3f} "
+        f"{hydrating_requests:>9}"
+    )
+    print(f"{'cold lazy':<16} {cold:>10.3f} {cold:>12.3f} {cold_requests:>9}")
+    print(f"{'snapshot':<16} {ready:>10.3f} {revalidated:>12.3f} {warm_requests:>9}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+    asyncio.run(main(args.devices, args.latency))
@@ -0,0 +1,318 @@
+"""
+Measure discovery and coordinator cycle throughput across a grid of accounts.
+
+Dimensions: device count, injected per-request latency and concurrency.
+Concurrency is location_page_concurrency for discovery and
+max_concurrent_refreshes for the coordinator cycle. Each grid point gets a
+fresh fake account (devices_per_location devices per location, 10
+locations per page) and a fresh client, then times:
+- discover: AIOSomeComfort.discover(hydrate=False), as setup does
+- cycle: the first MyHoneywellCoordinator._async_update_data, every device due
+
+Reported for each: wall time, requests served, peak traced memory above
+what was allocated at the start, and event-loop lag (max and mean delay of
+a 10ms sampler). Time and lag come from a run with tracemalloc off; each
+grid point is then run again with tracing on for the memory peak alone,
+since tracing slows the code it watches several times over. The fake
+server runs on its own event loop in a thread so its work doesn't count as
+lag, but its allocations do show up in the memory peak. Grid points whose
+cycle is estimated (ceil(N / conc) * latency) to take over --max-seconds
+are skipped.
+
+The cycle needs Home Assistant installed; --discover-only runs without it.
+
+Usage: python benchmarks/bench_throughput.py [--devices 1,10,100,500]
+       [--latency 0,0.05,0.5] [--concurrency 1,4,16] [--discover-only]
+       [--max-seconds 30] [--csv results.csv]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import datetime
+import gc
+import math
+import pathlib
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+import aiohttp
+
+sys.path.insert(
+    0,
+    str(
+        pathlib.Path(__file__).resolve().parents[1]
+        / "custom_components"
+        / "my_honeywell"
+    ),
+)
+
+from aiosomecomfort import AIOSomeComfort  # noqa: E402
+
+from fake_tcc import FakeTCCServer  # noqa: E402
+
+LAG_INTERVAL = 0.01  # seconds between event-loop lag samples
+
+
+@dataclass
+class Result:
+    """One measured operation at one grid point."""
+
+    target: str
+    devices: int
+    latency_ms: float
+    concurrency: int
+    seconds: float
+    requests: int
+    peak_mib: float
+    lag_max_ms: float
+    lag_mean_ms: float
+
+
+class ServerThread:
+    """Run a FakeTCCServer on its own event loop in a background thread."""
+
+    def __init__(self, **kwargs) -> None:
+        self.server = FakeTCCServer(**kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def __enter__(self) -> FakeTCCServer:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self.server
+
+    def __exit__(self, *exc_info) -> None:
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+async def measure(
+    coro, server: FakeTCCServer, trace: bool
+) -> tuple[float, int, float, list[float]]:
+    """Run coro; return seconds, requests, peak MiB over the start and lag samples.
+
+    The peak is only measured (and otherwise 0) with trace set, which also
+    makes the time and lag figures meaningless.
+    """
+    loop = asyncio.get_running_loop()
+    lags: list[float] = []
+
+    async def sample_lag() -> None:
+        while True:
+            before = loop.time()
+            await asyncio.sleep(LAG_INTERVAL)
+            lags.append(loop.time() - before - LAG_INTERVAL)
+
+    sampler = asyncio.ensure_future(sample_lag())
+    requests = server.requests
+    gc.collect()
+    baseline = peak = 0
+    if trace:
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    try:
+        await coro
+    finally:
+        elapsed = time.perf_counter() - start
+        sampler.cancel()
+        if trace:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return elapsed, server.requests - requests, (peak - baseline) / 2**20, lags or [0.0]
+
+
+def make_result(
+    target: str, devices: int, latency: float, concurrency: int, measured
+) -> Result:
+    """Build a Result from measure()'s output."""
+    seconds, requests, peak, lags = measured
+    return Result(
+        target=target,
+        devices=devices,
+        latency_ms=latency * 1000,
+        concurrency=concurrency,
+        seconds=round(seconds, 3),
+        requests=requests,
+        peak_mib=round(peak, 2),
+        lag_max_ms=round(max(lags) * 1000, 2),
+        lag_mean_ms=round(statistics.fmean(lags) * 1000, 2),
+    )
+
+
+async def run_point(
+    devices: int,
+    latency: float,
+    concurrency: int,
+    devices_per_location: int,
+    hass=None,
+    trace: bool = False,
+) -> list[Result]:
+    """Measure discovery, and the first cycle if hass is given, at one grid point."""
+    with ServerThread(
+        devices=devices,
+        latency=latency,
+        locations=math.ceil(devices / devices_per_location),
+        seed=1,
+    ) as server:
+        async with aiohttp.ClientSession(
+            cookie_jar=aiohttp.CookieJar(unsafe=True)
+        ) as session:
+            if hass is None:
+                client = AIOSomeComfort(
+                    "bench",
+                    "bench",
+                    session=session,
+                    location_page_concurrency=concurrency,
+                    request_rate=1e6,
+                    request_burst=1_000_000,
+                    baseurl=server.url,
+                )
+            else:
+                # The coordinator catches the package's own exception classes
+                from harness import make_client
+
+                client = make_client(
+                    session, server.url, location_page_concurrency=concurrency
+                )
+            await client.login()
+            results = [
+                make_result(
+                    "discover",
+                    devices,
+                    latency,
+                    concurrency,
+                    await measure(client.discover(hydrate=False), server, trace),
+                )
+            ]
+            if hass is None:
+                return results
+
+            from harness import make_coordinator
+
+            from custom_components.my_honeywell.const import (
+                CONF_MAX_CONCURRENT_REFRESHES,
+            )
+
+            coordinator = make_coordinator(
+                hass,
+                client,
+                f"throughput-{devices}-{latency}-{concurrency}",
+                {CONF_MAX_CONCURRENT_REFRESHES: concurrency},
+            )
+            results.append(
+                make_result(
+                    "cycle",
+                    devices,
+                    latency,
+                    concurrency,
+                    await measure(coordinator._async_update_data(), server, trace),
+                )
+            )
+            return results
+
+
+def print_table(results: list[Result]) -> None:
+    """Print results as a fixed-width table."""
+    print(
+        f"{'target':<9} {'devices':>7} {'lat ms':>6} {'conc':>4} {'seconds':>8} "
+        f"{'requests':>8} {'peak MiB':>8} {'lag max ms':>10} {'lag mean ms':>11}"
+    )
+    for result in results:
+        print(
+            f"{result.target:<9} {result.devices:>7} {result.latency_ms:>6.0f} "
+            f"{result.concurrency:>4} {result.seconds:>8.3f} {result.requests:>8} "
+            f"{result.peak_mib:>8.2f} {result.lag_max_ms:>10.2f} "
+            f"{result.lag_mean_ms:>11.2f}"
+        )
+
+
+def append_csv(path: str, results: list[Result]) -> None:
+    """Append results to a CSV file, writing the header for a new file."""
+    run_at = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+    new = not pathlib.Path(path).exists()
+    with open(path, "a", newline="") as file:
+        writer = csv.DictWriter(file, ["run_at", *Result.__dataclass_fields__])
+        if new:
+            writer.writeheader()
+        for result in results:
+            writer.writerow({"run_at": run_at, **asdict(result)})
+
+
+def parse_list(value: str, kind=float) -> list:
+    """Parse a comma-separated list."""
+    return [kind(item) for item in value.split(",")]
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the grid and report."""
+    hass = None
+    config_dir = tempfile.TemporaryDirectory()
+    if not args.discover_only:
+        from harness import HomeAssistant
+
+        hass = HomeAssistant(config_dir.name)
+
+    results = []
+    skipped = 0
+    for devices in args.devices:
+        for latency in args.latency:
+            for concurrency in args.concurrency:
+                if (
+                    hass is not None
+                    and math.ceil(devices / concurrency) * latency > args.max_seconds
+                ):
+                    skipped += 1
+                    continue
+                timed = await run_point(
+                    devices, latency, concurrency, args.devices_per_location, hass
+                )
+                traced = await run_point(
+                    devices,
+                    latency,
+                    concurrency,
+                    args.devices_per_location,
+                    hass,
+                    trace=True,
+                )
+                for result, memory in zip(timed, traced):
+                    result.peak_mib = memory.peak_mib
+                results.extend(timed)
+    if hass is not None:
+        await hass.async_stop(force=True)
+    config_dir.cleanup()
+
+    print_table(results)
+    if skipped:
+        print(f"skipped {skipped} grid points estimated over {args.max_seconds:.0f}s")
+    if args.csv:
+        append_csv(args.csv, results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--devices",
+        type=lambda value: parse_list(value, int),
+        default=[1, 10, 100, 500],
+    )
+    parser.add_argument("--latency", type=parse_list, default=[0, 0.05, 0.5])
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: parse_list(value, int),
+        default=[1, 4, 16],
+    )
+    parser.add_argument("--devices-per-location", type=int, default=5)
+    parser.add_argument("--discover-only", action="store_true")
+    parser.add_argument("--max-seconds", type=float, default=30.0)
+    parser.add_argument("--csv")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,529 @@
+"""
+Local stand-in for mytotalconnectcomfort.com.
+
+Serves the parts of the TCC portal AIOSomeComfort uses: /portal login,
+GetLocationListData paging, CheckDataSession, Menu/GetData,
+SubmitControlScreenChanges and the Menu/Humidifier and Menu/Dehumidifier
+settings. Any number of locations and devices can be generated; with a seed,
+devices get varied, realistic payloads (units, modes, holds, missing
+sensors, humidifiers, offline thermostats) instead of identical copies.
+
+Like the real portal, login sets the .ASPXAUTH_TRUEHOME cookie with an
+expiry in year 1, so a client that doesn't patch the cookie loses its
+session straight away.
+
+Faults can be switched on with inject(); see FaultProfile and PROFILES.
+
+Point a client at it with ``AIOSomeComfort(..., baseurl=server.url)`` and a
+session whose cookie jar is ``aiohttp.CookieJar(unsafe=True)``.
+
+Run standalone to serve until interrupted:
+python benchmarks/fake_tcc.py [--devices 5] [--locations 2] [--seed 1] [--port 8080]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import math
+import random
+import time
+from typing import Callable
+
+from aiohttp import web
+
+AUTH_COOKIE = ".ASPXAUTH_TRUEHOME"
+# The portal sends its auth cookie expiring at .NET DateTime.MinValue
+MALFORMED_COOKIE = "{name}={value}; expires=Mon, 01-Jan-0001 00:00:00 GMT; path=/; HttpOnly"
+
+ROOM_NAMES = (
+    "Downstairs", "Upstairs", "Living Room", "Bedroom", "Basement",
+    "Office", "Kitchen", "Guest Room", "Garage", "Attic",
+)
+LOCATION_NAMES = ("Home", "Cabin", "Office", "Rental", "Lake House")
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """
+    Faults the server injects for `duration` seconds after inject().
+
+    Rates are the chance per request. Errors (503) hit every endpoint,
+    login included; 401s, redirects and slow bodies only hit the JSON API.
+    A 401 also drops every session, as when the portal expires them all.
+    null_cookie makes the login check hand back an empty auth cookie.
+    expire_sessions drops every session on injection, forcing a login.
+    slow_body trickles each JSON body out over that many seconds.
+    """
+
+    name: str
+    duration: float = 5.0
+    latency: Callable[[random.Random], float] | None = None
+    error_rate: float = 0.0
+    unauthorized_rate: float = 0.0
+    redirect_rate: float = 0.0
+    null_cookie: bool = False
+    expire_sessions: bool = False
+    slow_body: float = 0.0
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        # Median 300ms with a long tail past a few seconds
+        FaultProfile(
+            "latency",
+            duration=10,
+            latency=lambda rng: rng.lognormvariate(math.log(0.3), 1.0),
+        ),
+        FaultProfile("503-burst", error_rate=1.0),
+        FaultProfile("503-flaky", duration=10, error_rate=0.3),
+        FaultProfile("401-storm", unauthorized_rate=1.0),
+        FaultProfile("redirect", redirect_rate=1.0),
+        FaultProfile("null-cookie", null_cookie=True, expire_sessions=True),
+        FaultProfile("slow-body", duration=10, slow_body=2.0),
+    )
+}
+
+
+def make_device(device_id: int, rng: random.Random | None = None) -> dict:
+    """Return a CheckDataSession payload for a thermostat.
+
+    Without rng this is always the same heat/cool thermostat in Fahrenheit
+    with a fan, idle and on schedule. With rng the payload varies the way
+    real accounts do.
+    """
+    celsius = comms_lost = False
+    system_switch, fan_mode, output = 1, 0, 0
+    status_heat = status_cool = next_period = 0
+    has_fan = indoor_humidity = outdoor = alive = True
+    emergency_heat = False
+    if rng is not None:
+        celsius = rng.random() < 0.2
+        system_switch = rng.choice((1, 1, 2, 3, 3, 4))
+        fan_mode = rng.choice((0, 0, 0, 1, 2))
+        output = rng.choice((0, 0, 0, 1, 2))
+        status_heat = status_cool = rng.choice((0, 0, 0, 1, 2))
+        next_period = rng.randrange(96) if status_heat == 1 else 0
+        has_fan = rng.random() < 0.9
+        indoor_humidity = rng.random() < 0.7
+        outdoor = rng.random() < 0.6
+        alive = rng.random() < 0.97
+        emergency_heat = rng.random() < 0.15
+        comms_lost = not alive and rng.random() < 0.5
+
+    if celsius:
+        limits = {"heat": (4.5, 32), "cool": (10, 37)}
+        indoor = 21.0 if rng is None else round(rng.uniform(17, 25) * 2) / 2
+        heat, cool, deadband = indoor - 1.5, indoor + 2.5, 1.5
+        outdoor_temp = 10.0 if rng is None else round(rng.uniform(-15, 35))
+    else:
+        limits = {"heat": (40, 90), "cool": (50, 99)}
+        indoor = 70 if rng is None else rng.randint(62, 78)
+        heat, cool, deadband = indoor - 2, indoor + 6, 3
+        outdoor_temp = 50 if rng is None else rng.randint(-5, 95)
+
+    return {
+        "success": True,
+        "deviceLive": alive,
+        "communicationLost": comms_lost,
+        "latestData": {
+            "hasFan": has_fan,
+            "canControlHumidification": False,
+            "uiData": {
+                "DispTemperature": indoor,
+                "DispTemperatureAvailable": True,
+                "DispTemperatureStatus": 0,
+                "HeatSetpoint": heat,
+                "CoolSetpoint": cool,
+                "HeatLowerSetptLimit": limits["heat"][0],
+                "HeatUpperSetptLimit": limits["heat"][1],
+                "CoolLowerSetptLimit": limits["cool"][0],
+                "CoolUpperSetptLimit": limits["cool"][1],
+                "ScheduleHeatSp": heat,
+                "ScheduleCoolSp": cool,
+                "Deadband": deadband,
+                "SystemSwitchPosition": system_switch,
+                "SwitchHeatAllowed": True,
+                "SwitchCoolAllowed": True,
+                "SwitchAutoAllowed": True,
+                "SwitchOffAllowed": True,
+                "SwitchEmergencyHeatAllowed": emergency_heat,
+                "StatusHeat": status_heat,
+                "StatusCool": status_cool,
+                "HeatNextPeriod": next_period,
+                "CoolNextPeriod": next_period,
+                "HoldUntilCapable": True,
+                "ScheduleCapable": True,
+                "VacationHold": 0,
+                "VacationHoldUntilTime": 0,
+                "VacationHoldCancelable": True,
+                "TemporaryHoldUntilTime": next_period * 15,
+                "CurrentSetpointStatus": status_heat,
+                "EquipmentOutputStatus": output,
+                "IndoorHumidity": 40 if rng is None else rng.randint(25, 60),
+                "IndoorHumiditySensorAvailable": indoor_humidity,
+                "IndoorHumiditySensorNotFault": True,
+                "IndoorHumidStatus": 0 if indoor_humidity else 128,
+                "OutdoorTemperature": outdoor_temp,
+                "OutdoorTemperatureAvailable": outdoor,
+                "OutdoorHumidity": 60 if rng is None else rng.randint(15, 95),
+                "OutdoorHumidityAvailable": outdoor,
+                "OutdoorHumidStatus": 0 if outdoor else 128,
+                "Commercial": False,
+                "IsInVacationHoldMode": False,
+                "DualSetpointStatus": False,
+                "DisplayUnits": "C" if celsius else "F",
+                "DeviceID": device_id,
+            },
+            "fanData": {
+                "fanMode": fan_mode,
+                "fanIsRunning": has_fan and (fan_mode == 1 or output != 0),
+                "fanModeAutoAllowed": True,
+                "fanModeOnAllowed": True,
+                "fanModeCirculateAllowed": True,
+                "fanModeFollowScheduleAllowed": False,
+            },
+            "drData": {
+                "CoolSetpLimit": None,
+                "HeatSetpLimit": None,
+                "Phase": -1,
+                "OptOutable": False,
+                "DeltaCoolSP": None,
+                "DeltaHeatSP": None,
+                "Load": None,
+            },
+        },
+    }
+
+
+def make_gdata(device_id: int, rng: random.Random | None = None) -> dict:
+    """Return a Menu/GetData payload; without rng the device has neither unit."""
+
+    def unit(setpoint: int, lower: int, upper: int) -> dict:
+        return {
+            "DeviceID": device_id,
+            "Setpoint": setpoint,
+            "LowerLimit": lower,
+            "UpperLimit": upper,
+            "Mode": rng.choice((0, 1)),
+            "CanControl": True,
+        }
+
+    if rng is None:
+        return {"Humidifier": None, "Dehumidifier": None}
+    return {
+        "Humidifier": unit(35, 10, 60) if rng.random() < 0.25 else None,
+        "Dehumidifier": unit(55, 40, 80) if rng.random() < 0.1 else None,
+    }
+
+
+class FakeTCCServer:
+    """
+    A local aiohttp server emulating the TCC portal endpoints.
+
+    latency is added to every request. With seed set, devices are generated
+    from a random.Random(seed), so the same seed gives the same account; with
+    churn, each CheckDataSession has that chance of moving the device's
+    temperature and humidity by a step first.
+    """
+
+    def __init__(
+        self,
+        devices: int = 1,
+        latency: float = 0.0,
+        locations: int = 1,
+        page_size: int = 10,
+        seed: int | None = None,
+        churn: float = 0.0,
+        username: str | None = None,
+        password: str | None = None,
+    ) -> None:
+        self.latency = latency
+        self.page_size = page_size
+        self.churn = churn
+        self.requests = 0
+        self.logins = 0
+        self.writes: list[dict] = []
+        # Client (host, port) pairs seen; one per TCP connection opened
+        self.peers: set[tuple] = set()
+        self._username = username
+        self._password = password
+        self._sessions: set[str] = set()
+        self._rng = random.Random(seed) if seed is not None else None
+        self._churn_rng = random.Random(seed)
+        self._devices = {
+            1000 + index: make_device(1000 + index, self._rng)
+            for index in range(devices)
+        }
+        self._gdata = {
+            device_id: make_gdata(device_id, self._rng) for device_id in self._devices
+        }
+        self._names = {
+            device_id: (
+                f"Thermostat {device_id}"
+                if self._rng is None
+                else f"{ROOM_NAMES[index % len(ROOM_NAMES)]} {index // len(ROOM_NAMES) + 1}"
+            )
+            for index, device_id in enumerate(self._devices)
+        }
+        # Deal devices out round-robin over the locations
+        self._location_devices = {
+            location_id: [
+                device_id
+                for index, device_id in enumerate(self._devices)
+                if index % locations == location_id - 1
+            ]
+            for location_id in range(1, locations + 1)
+        }
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+        self.fault_responses = 0
+        self._fault: FaultProfile | None = None
+        self._fault_ends = 0.0
+        self._fault_rng = random.Random(seed)
+
+    async def start(self, port: int = 0) -> None:
+        """Start listening on a local port, random by default."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/portal", self._login)
+        app.router.add_get("/portal", self._portal)
+        app.router.add_post(
+            "/portal/Location/GetLocationListData/", self._locations
+        )
+        app.router.add_get(
+            "/portal/Device/CheckDataSession/{device_id}", self._check_data
+        )
+        app.router.add_post("/portal/Device/Menu/GetData", self._get_data)
+        app.router.add_post(
+            "/portal/Device/Menu/{which:Humidifier|Dehumidifier}",
+            self._set_humidity,
+        )
+        app.router.add_post(
+            "/portal/Device/SubmitControlScreenChanges", self._submit_changes
+        )
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    def inject(self, profile: FaultProfile | None) -> None:
+        """Start injecting a profile's faults now; None stops any."""
+        self._fault = profile
+        if profile is not None:
+            self._fault_ends = time.monotonic() + profile.duration
+            if profile.expire_sessions:
+                self.expire_sessions()
+
+    @property
+    def active_fault(self) -> FaultProfile | None:
+        """The profile being injected, if its faults haven't run out."""
+        if self._fault is not None and time.monotonic() < self._fault_ends:
+            return self._fault
+        return None
+
+    def _roll(self, rate: float) -> bool:
+        return rate > 0 and self._fault_rng.random() < rate
+
+    def expire_sessions(self) -> None:
+        """Invalidate every issued session cookie."""
+        self._sessions.clear()
+
+    def _authorized(self, request: web.Request) -> bool:
+        return request.cookies.get(AUTH_COOKIE) in self._sessions
+
+    async def stop(self) -> None:
+        """Shut the server down."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        fault = self.active_fault
+        if fault is None:
+            return await handler(request)
+
+        api = request.path != "/portal"
+        if fault.latency is not None:
+            await asyncio.sleep(fault.latency(self._fault_rng))
+        if self._roll(fault.error_rate):
+            self.fault_responses += 1
+            return web.Response(status=503)
+        if api and self._roll(fault.unauthorized_rate):
+            self.fault_responses += 1
+            self.expire_sessions()
+            return web.Response(status=401)
+        if api and self._roll(fault.redirect_rate):
+            self.fault_responses += 1
+            raise web.HTTPFound("/portal")
+        response = await handler(request)
+        if api and fault.slow_body and isinstance(response, web.Response) and response.body:
+            self.fault_responses += 1
+            return await self._trickle(request, response, fault.slow_body)
+        return response
+
+    @staticmethod
+    async def _trickle(
+        request: web.Request, response: web.Response, seconds: float, chunks: int = 10
+    ) -> web.StreamResponse:
+        """Send a response's body in chunks spread over `seconds`."""
+        body = response.body
+        stream = web.StreamResponse(status=response.status)
+        stream.content_type = response.content_type
+        await stream.prepare(request)
+        size = -(-len(body) // chunks)
+        for start in range(0, len(body), size):
+            await stream.write(body[start:start + size])
+            await asyncio.sleep(seconds / chunks)
+        await stream.write_eof()
+        return stream
+
+    async def _login(self, request: web.Request) -> web.Response:
+        if self._username is not None and (
+            request.query.get("UserName") != self._username
+            or request.query.get("Password") != self._password
+        ):
+            return web.Response(status=401)
+        self.logins += 1
+        session = f"fake-session-{self.logins}"
+        self._sessions.add(session)
+        response = web.Response(text="<html></html>", content_type="text/html")
+        response.headers.add(
+            "Set-Cookie", MALFORMED_COOKIE.format(name=AUTH_COOKIE, value=session)
+        )
+        return response
+
+    async def _portal(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        response = web.Response(text="<html></html>", content_type="text/html")
+        fault = self.active_fault
+        if fault is not None and fault.null_cookie:
+            self.fault_responses += 1
+            response.set_cookie(AUTH_COOKIE, "")
+        return response
+
+    async def _locations(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        page = int(request.query.get("page", "1"))
+        location_ids = list(self._location_devices)
+        start = (page - 1) * self.page_size
+        return web.json_response(
+            [
+                {
+                    "LocationID": location_id,
+                    "Name": LOCATION_NAMES[(location_id - 1) % len(LOCATION_NAMES)],
+                    "Devices": [
+                        {
+                            "DeviceID": device_id,
+                            "MacID": f"00D02D{device_id:06X}",
+                            "Name": self._names[device_id],
+                            "DeviceType": 24,
+                            "IsAlive": self._devices[device_id]["deviceLive"],
+                        }
+                        for device_id in self._location_devices[location_id]
+                    ],
+                }
+                for location_id in location_ids[start:start + self.page_size]
+            ]
+        )
+
+    def _drift(self, device: dict) -> None:
+        """Move a device's readings by one step, as a real house would."""
+        ui_data = device["latestData"]["uiData"]
+        step = 0.5 if ui_data["DisplayUnits"] == "C" else 1
+        ui_data["DispTemperature"] += self._churn_rng.choice((-step, step))
+        ui_data["IndoorHumidity"] = min(
+            95, max(5, ui_data["IndoorHumidity"] + self._churn_rng.choice((-1, 1)))
+        )
+
+    async def _check_data(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        device_id = int(request.match_info["device_id"])
+        if device_id not in self._devices:
+            return web.Response(status=404)
+        device = self._devices[device_id]
+        if self.churn and self._churn_rng.random() < self.churn:
+            self._drift(device)
+        return web.json_response(device)
+
+    async def _get_data(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        gdata = self._gdata.get(int(request.query.get("deviceID", "0")))
+        if gdata is None:
+            return web.Response(status=404)
+        return web.json_response(gdata)
+
+    async def _set_humidity(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        body = await request.json()
+        self.writes.append(body)
+        gdata = self._gdata.get(body.get("DeviceID"))
+        which = request.match_info["which"]
+        if gdata is None or gdata[which] is None:
+            return web.Response(status=404)
+        for key in ("Setpoint", "Mode"):
+            if body.get(key) is not None:
+                gdata[which][key] = body[key]
+        # The portal acknowledges these with an empty binary body
+        return web.Response(body=b"", content_type="application/octet-stream")
+
+    async def _submit_changes(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        body = await request.json()
+        self.writes.append(body)
+        device = self._devices.get(body.get("DeviceID"))
+        if device is None:
+            return web.json_response({"success": 0})
+        ui_data = device["latestData"]["uiData"]
+        for key in ("HeatSetpoint", "CoolSetpoint", "StatusHeat", "StatusCool",
+                    "HeatNextPeriod", "CoolNextPeriod"):
+            if body.get(key) is not None:
+                ui_data[key] = body[key]
+        if body.get("SystemSwitch") is not None:
+            ui_data["SystemSwitchPosition"] = body["SystemSwitch"]
+        if body.get("FanMode") is not None:
+            device["latestData"]["fanData"]["fanMode"] = body["FanMode"]
+        return web.json_response({"success": 1})
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Serve until interrupted."""
+    server = FakeTCCServer(
+        devices=args.devices,
+        locations=args.locations,
+        latency=args.latency,
+        seed=args.seed,
+        churn=args.churn,
+    )
+    await server.start(args.port)
+    print(f"Fake TCC portal at {server.url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=5)
+    parser.add_argument("--locations", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--churn", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8080)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
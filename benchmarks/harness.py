@@ -0,0 +1,53 @@
+"""Shared helpers for driving the integration in benchmarks."""
+from __future__ import annotations
+
+import pathlib
+import sys
+from types import SimpleNamespace
+
+import aiohttp
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.my_honeywell import MyHoneywellCoordinator  # noqa: E402
+from custom_components.my_honeywell.aiosomecomfort import AIOSomeComfort  # noqa: E402
+from custom_components.my_honeywell.const import DOMAIN  # noqa: E402
+
+
+class _NullStore:
+    """Stand-in for homeassistant.helpers.storage.Store that never writes."""
+
+    def async_delay_save(self, data_func, delay: float = 0) -> None:
+        """Discard the save."""
+
+
+def make_session() -> aiohttp.ClientSession:
+    """Return a session whose cookie jar accepts cookies from 127.0.0.1."""
+    return aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar(unsafe=True))
+
+
+def make_client(session: aiohttp.ClientSession, url: str, **kwargs) -> AIOSomeComfort:
+    """Return a client pointed at a fake server, without rate limiting."""
+    kwargs.setdefault("request_rate", 1e6)
+    kwargs.setdefault("request_burst", 1_000_000)
+    return AIOSomeComfort("bench", "bench", session=session, baseurl=url, **kwargs)
+
+
+def make_coordinator(
+    hass: HomeAssistant, client: AIOSomeComfort, name: str, options: dict | None = None
+) -> MyHoneywellCoordinator:
+    """Register a client's devices in hass.data and build a coordinator."""
+    entry = SimpleNamespace(entry_id=name, title=name, data={}, options=options or {})
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "client": client,
+        "devices": [
+            device
+            for location in client.locations_by_id.values()
+            for device in location.devices_by_id.values()
+        ],
+        "session_store": _NullStore(),
+        "snapshot_store": _NullStore(),
+    }
+    return MyHoneywellCoordinator(hass, entry)
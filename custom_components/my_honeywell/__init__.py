@@ -10,33 +10,51 @@ from __future__ import annotations
 
 import asyncio
 from datetime import timedelta
+import json
 import logging
+import time
 from typing import Any
 
-import aiohttp
-
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
+    CONF_API_CALLS_PER_HOUR,
     CONF_COOL_AWAY_TEMPERATURE,
     CONF_HEAT_AWAY_TEMPERATURE,
+    CONF_MAX_CONCURRENT_REFRESHES,
+    DEFAULT_API_CALLS_PER_HOUR,
     DEFAULT_COOL_AWAY_TEMPERATURE,
     DEFAULT_HEAT_AWAY_TEMPERATURE,
+    DEFAULT_MAX_CONCURRENT_REFRESHES,
     DEFAULT_RETRY_COUNT,
-    DEFAULT_SCAN_INTERVAL,
+    DEVICE_SECTIONS,
     DOMAIN,
+    LOCATION_PAGE_CONCURRENCY,
+    POLL_INTERVAL_ACTIVE,
+    SESSION_SAVE_DELAY,
+    SNAPSHOT_SAVE_INTERVAL,
+    STORAGE_KEY_SESSION,
+    STORAGE_KEY_SNAPSHOT,
+    STORAGE_VERSION,
+    WRITE_COALESCE_WINDOW,
 )
+from .health import ApiHealth
+from .scheduler import PollScheduler
+from .session import async_create_session
 
 # Import our improved library
 from .aiosomecomfort import (
     AIOSomeComfort,
     AuthError,
     APIRateLimited,
+    CircuitOpen,
     ConnectionError as SomeComfortConnectionError,
+    InvalidCredentials,
     ServiceUnavailable,
     SomeComfortError,
     UnauthorizedError,
@@ -61,8 +79,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data.get(CONF_HEAT_AWAY_TEMPERATURE, DEFAULT_HEAT_AWAY_TEMPERATURE)
     )
 
-    # Create a session that persists
-    session = aiohttp.ClientSession()
+    # A session of our own (own cookie jar) on the shared, tuned connector
+    session = async_create_session(hass)
 
     # Create our improved client
     client = AIOSomeComfort(
@@ -70,14 +88,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         password=password,
         session=session,
         retry_count=DEFAULT_RETRY_COUNT,
+        location_page_concurrency=LOCATION_PAGE_CONCURRENCY,
+        write_coalesce_window=WRITE_COALESCE_WINDOW,
+        metrics=True,
+    )
+
+    # Reuse the session cookie from the last run if we have one; a rejected
+    # cookie gets a 401 and the client falls back to a full login
+    session_store = Store(
+        hass, STORAGE_VERSION, STORAGE_KEY_SESSION.format(entry_id=entry.entry_id)
+    )
+    if saved_session := await session_store.async_load():
+        try:
+            client.restore_session(**saved_session)
+        except (KeyError, TypeError, ValueError) as ex:
+            _LOGGER.debug("Ignoring unreadable saved session, logging in: %s", ex)
+
+    # Start from the last saved device snapshot if there is one; login and
+    # refresh then happen in the background instead of blocking setup
+    snapshot_store = Store(
+        hass, STORAGE_VERSION, STORAGE_KEY_SNAPSHOT.format(entry_id=entry.entry_id)
     )
+    from_snapshot = False
+    if snapshot := await snapshot_store.async_load():
+        try:
+            client.restore_snapshot(snapshot)
+            from_snapshot = True
+        except (KeyError, TypeError) as ex:
+            _LOGGER.warning("Ignoring unreadable device snapshot: %s", ex)
 
     try:
-        await client.login()
-        await client.discover()
-    except AuthError as ex:
+        if not from_snapshot:
+            await client.ensure_authenticated()
+            # Devices are hydrated by the coordinator's first refresh
+            await client.discover(hydrate=False)
+    except InvalidCredentials as ex:
         await session.close()
         raise ConfigEntryAuthFailed(f"Authentication failed: {ex}") from ex
+    except AuthError as ex:
+        # Null cookie or failed verification: the portal, not the password
+        await session.close()
+        raise ConfigEntryNotReady(f"Login failed: {ex}") from ex
     except APIRateLimited as ex:
         await session.close()
         raise ConfigEntryNotReady(f"Rate limited: {ex}") from ex
@@ -95,7 +146,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await session.close()
         raise ConfigEntryNotReady("No devices found")
 
-    _LOGGER.info("Found %d Honeywell device(s)", len(devices))
+    _LOGGER.info(
+        "Found %d Honeywell device(s)%s",
+        len(devices),
+        " in saved snapshot" if from_snapshot else "",
+    )
 
     # Store data in hass.data
     hass.data.setdefault(DOMAIN, {})
@@ -105,21 +160,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "cool_away_temp": cool_away_temp,
         "heat_away_temp": heat_away_temp,
         "session": session,
+        "session_store": session_store,
+        "snapshot_store": snapshot_store,
     }
 
     # Create coordinator with improved error handling
     coordinator = MyHoneywellCoordinator(hass, entry)
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
-
-    # Do initial refresh
-    await coordinator.async_config_entry_first_refresh()
+    coordinator.async_save_session()
+
+    if from_snapshot:
+        coordinator.async_set_stale_data()
+    else:
+        # Do initial refresh
+        await coordinator.async_config_entry_first_refresh()
+        if not all(device.is_hydrated for device in devices):
+            hass.data[DOMAIN].pop(entry.entry_id)
+            await session.close()
+            raise ConfigEntryNotReady("Could not load data for every device")
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if from_snapshot:
+        entry.async_create_background_task(
+            hass, coordinator.async_revalidate(), f"{DOMAIN} revalidate {entry.title}"
+        )
+
+    # Reload when options change so new settings take effect
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -134,6 +212,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved session and snapshot when a config entry is deleted."""
+    for key in (STORAGE_KEY_SESSION, STORAGE_KEY_SNAPSHOT):
+        await Store(
+            hass, STORAGE_VERSION, key.format(entry_id=entry.entry_id)
+        ).async_remove()
+
+
 class MyHoneywellCoordinator(DataUpdateCoordinator):
     """
     Improved coordinator with automatic retry and re-authentication.
@@ -148,17 +234,232 @@ class MyHoneywellCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=DEFAULT_SCAN_INTERVAL,
+            # Tick at the fastest interval; the scheduler picks who is due
+            update_interval=POLL_INTERVAL_ACTIVE,
         )
         self.entry = entry
         self._consecutive_errors = 0
         self._max_consecutive_errors = 5
+        self._max_concurrent_refreshes = entry.options.get(
+            CONF_MAX_CONCURRENT_REFRESHES, DEFAULT_MAX_CONCURRENT_REFRESHES
+        )
+        self.scheduler = PollScheduler(
+            entry.options.get(CONF_API_CALLS_PER_HOUR, DEFAULT_API_CALLS_PER_HOUR)
+        )
+        self._saved_session_started: float | None = None
+        # Set once the device list no longer matches the account
+        self._snapshot_outdated = False
+        self._snapshot_saved_at: float | None = None
+        self._device_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._device_refreshes: dict[str, asyncio.Task] = {}
+        self._section_hashes: dict[str, dict[str, int]] = {}
+        # Entity state writes issued / skipped because nothing they show changed
+        self.state_writes_issued = 0
+        self.state_writes_skipped = 0
+        # Figures shown by the diagnostic sensors
+        self.health = ApiHealth()
 
     def _get_data(self):
         """Get the integration data from hass.data."""
         return self.hass.data[DOMAIN][self.entry.entry_id]
 
+    @callback
+    def async_save_session(self) -> None:
+        """Persist the client's session cookie whenever it changes."""
+        integration_data = self._get_data()
+        session = integration_data["client"].export_session()
+        if session is None or session["started"] == self._saved_session_started:
+            return
+        self._saved_session_started = session["started"]
+        integration_data["session_store"].async_delay_save(
+            lambda: session, SESSION_SAVE_DELAY
+        )
+
+    @callback
+    def async_save_snapshot(self) -> None:
+        """
+        Persist the device snapshot at most once per SNAPSHOT_SAVE_INTERVAL.
+
+        Store.async_delay_save restarts its timer on every call, so calling
+        it each poll with a long delay would only ever write on shutdown.
+        """
+        if self._snapshot_outdated:
+            return
+        now = time.monotonic()
+        if (
+            self._snapshot_saved_at is not None
+            and now - self._snapshot_saved_at < SNAPSHOT_SAVE_INTERVAL
+        ):
+            return
+        self._snapshot_saved_at = now
+        integration_data = self._get_data()
+        integration_data["snapshot_store"].async_delay_save(
+            integration_data["client"].snapshot, 0
+        )
+
+    @callback
+    def async_set_stale_data(self) -> None:
+        """Serve the restored snapshot, marked stale, until the first refresh."""
+        self.data = {
+            device.deviceid: {
+                "device": device,
+                "available": device.is_alive,
+                "stale": True,
+            }
+            for device in self._get_data()["devices"]
+        }
+
+    async def async_revalidate(self) -> None:
+        """Refresh snapshot devices, then check the account for added or removed ones."""
+        await self.async_refresh()
+
+        integration_data = self._get_data()
+        known = {device.deviceid for device in integration_data["devices"]}
+        try:
+            found = await integration_data["client"].get_device_ids()
+        except SomeComfortError as ex:
+            _LOGGER.warning("Could not verify device list after startup: %s", ex)
+            return
+        if found and found != known:
+            _LOGGER.info("Device list changed since last run, reloading")
+            # Drop the snapshot so the reload runs a full discovery instead of
+            # restoring the same device list again
+            self._snapshot_outdated = True
+            await integration_data["snapshot_store"].async_remove()
+            self.hass.config_entries.async_schedule_reload(self.entry.entry_id)
+
+    @callback
+    def async_add_device_listener(
+        self, device_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for refreshes of a single device; return a remover."""
+        listeners = self._device_listeners.setdefault(device_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_device(self, device_id: str) -> None:
+        """Call the listeners of a single device."""
+        for update_callback in list(self._device_listeners.get(device_id, [])):
+            update_callback()
+
+    @callback
+    def async_device_written(self, device) -> None:
+        """
+        Show a device's written values now and refresh it in the background.
+
+        The device keeps its pending writes over polled values until the
+        server confirms them; the refresh lets it confirm them without
+        waiting for the next scheduled poll.
+        """
+        self.scheduler.note_write(device.deviceid)
+        self._async_notify_device(device.deviceid)
+        self.entry.async_create_background_task(
+            self.hass,
+            self.async_refresh_device(device),
+            f"{DOMAIN} refresh {device.name}",
+        )
+
+    async def async_refresh_device(self, device) -> None:
+        """
+        Refresh one device and notify only that device's entities.
+
+        Concurrent calls for the same device share one request.
+        """
+        task = self._device_refreshes.get(device.deviceid)
+        if task is None or task.done():
+            task = self.hass.async_create_task(
+                self._async_refresh_single_device(device)
+            )
+            self._device_refreshes[device.deviceid] = task
+        await asyncio.shield(task)
+
+    async def _async_refresh_single_device(self, device) -> None:
+        """Refresh one device, merge it into data and notify its listeners."""
+        result = await self._async_refresh_device(device, asyncio.Semaphore(1))
+        self.data = {**(self.data or {}), device.deviceid: self._diff_device(result)}
+        self._async_notify_device(device.deviceid)
+
+    def _diff_device(self, result: dict[str, Any]) -> dict[str, Any]:
+        """Record in the result which sections changed since the last refresh."""
+        device = result["device"]
+        data = device._data or {}
+        hashes = {
+            section: hash(json.dumps(data.get(section), sort_keys=True))
+            for section in DEVICE_SECTIONS
+        }
+        hashes["gdata"] = hash(json.dumps(device._gdata, sort_keys=True))
+        hashes["status"] = hash((result["available"], data.get("hasFan")))
+
+        previous = self._section_hashes.get(device.deviceid)
+        self._section_hashes[device.deviceid] = hashes
+        if previous is None:
+            result["changed"] = frozenset(hashes)
+        else:
+            result["changed"] = frozenset(
+                section for section, value in hashes.items()
+                if previous.get(section) != value
+            )
+        return result
+
+    def _unchanged_data(self) -> dict[str, Any]:
+        """Return the current data with nothing marked as changed."""
+        return {
+            device_id: {**device_data, "changed": frozenset()}
+            for device_id, device_data in (self.data or {}).items()
+        }
+
+    async def _async_refresh_device(
+        self, device, semaphore: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        """Refresh a single device, isolating its errors from the others."""
+        async with semaphore:
+            try:
+                await device.refresh()
+            except CircuitOpen:
+                # Not sent; keep what we had and try again next tick
+                previous = (self.data or {}).get(device.deviceid)
+                return previous or {"device": device, "available": False}
+            except SomeComfortError as ex:
+                _LOGGER.warning("Failed to refresh %s: %s", device.name, ex)
+                self.scheduler.record_refresh(device, success=False)
+                return {
+                    "device": device,
+                    "available": False,
+                }
+
+        self.scheduler.record_refresh(device, success=True)
+        _LOGGER.debug(
+            "Refreshed %s: temp=%s, mode=%s",
+            device.name,
+            device.current_temperature,
+            device.system_mode,
+        )
+        return {
+            "device": device,
+            "available": device.is_alive,
+        }
+
     async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data, then record the cycle's API health figures."""
+        start = time.monotonic()
+        try:
+            return await self._async_fetch_data()
+        finally:
+            integration_data = self._get_data()
+            self.health.record_cycle(
+                time.monotonic() - start,
+                integration_data["client"].metrics_snapshot(),
+                self._consecutive_errors,
+                integration_data["devices"],
+            )
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """
         Fetch data with robust error handling.
 
@@ -166,56 +467,70 @@ class MyHoneywellCoordinator(DataUpdateCoordinator):
         1. Automatic re-authentication on auth errors
         2. Graceful handling of transient errors
         3. Progressive backoff on repeated failures
+        4. Concurrent device refreshes, capped at max_concurrent_refreshes
+        5. Per-device adaptive polling; devices not yet due keep their data
+        6. Change detection; each device's data lists the sections that
+           changed so entities can skip writing identical state
+        7. No requests while the client's circuit breaker is open
         """
         integration_data = self._get_data()
         client = integration_data["client"]
         devices = integration_data["devices"]
 
+        if client.circuit_open:
+            _LOGGER.debug("TCC circuit breaker open, serving last data")
+            return self._unchanged_data()
+
         try:
             # Ensure we're authenticated
             await client.ensure_authenticated()
 
-            # Refresh all devices
-            device_data = {}
-            for device in devices:
-                try:
-                    await device.refresh()
-                    device_data[device.deviceid] = {
-                        "device": device,
-                        "available": device.is_alive,
-                    }
-                    _LOGGER.debug(
-                        "Refreshed %s: temp=%s, mode=%s",
-                        device.name,
-                        device.current_temperature,
-                        device.system_mode,
-                    )
-                except SomeComfortError as ex:
-                    _LOGGER.warning("Failed to refresh %s: %s", device.name, ex)
-                    device_data[device.deviceid] = {
-                        "device": device,
-                        "available": False,
-                    }
+            # Refresh due devices concurrently, bounded by the semaphore
+            due = self.scheduler.due_devices(devices)
+            semaphore = asyncio.Semaphore(self._max_concurrent_refreshes)
+            results = await asyncio.gather(
+                *(self._async_refresh_device(device, semaphore) for device in due),
+                return_exceptions=True,
+            )
+
+            device_data = self._unchanged_data()
+            for device, result in zip(due, results):
+                if isinstance(result, BaseException):
+                    raise result
+                device_data[device.deviceid] = self._diff_device(result)
+            _LOGGER.debug(
+                "State writes so far: %d issued, %d skipped as unchanged",
+                self.state_writes_issued,
+                self.state_writes_skipped,
+            )
 
             # Reset error counter on success
             self._consecutive_errors = 0
+            self.async_save_session()
+            self.async_save_snapshot()
             return device_data
 
         except UnauthorizedError as ex:
-            _LOGGER.warning("Session expired, attempting re-authentication: %s", ex)
-            try:
-                await client.login()
-                # Retry the update after re-auth
-                return await self._async_update_data()
-            except AuthError as auth_ex:
-                self._consecutive_errors += 1
-                raise UpdateFailed(f"Re-authentication failed: {auth_ex}") from auth_ex
+            # The client already re-authenticated within its retry budget;
+            # retrying here would multiply attempts, so wait for the next tick
+            self._consecutive_errors += 1
+            raise UpdateFailed(f"Session could not be renewed: {ex}") from ex
+
+        except InvalidCredentials as ex:
+            self._consecutive_errors += 1
+            raise ConfigEntryAuthFailed(f"Authentication failed: {ex}") from ex
+
+        except AuthError as ex:
+            # Null cookie or failed verification: the portal is misbehaving,
+            # so keep polling rather than asking the user to re-authenticate
+            self._consecutive_errors += 1
+            raise UpdateFailed(f"Login failed: {ex}") from ex
 
         except APIRateLimited as ex:
             self._consecutive_errors += 1
             _LOGGER.warning("Rate limited, will retry later: %s", ex)
             # Don't raise UpdateFailed for rate limiting - just skip this update
-            return self.data if self.data else {}
+            return self._unchanged_data()
 
         except ServiceUnavailable as ex:
             self._consecutive_errors += 1
@@ -228,7 +543,7 @@ class MyHoneywellCoordinator(DataUpdateCoordinator):
             if self._consecutive_errors >= self._max_consecutive_errors:
                 raise UpdateFailed(f"Service unavailable after {self._consecutive_errors} attempts: {ex}") from ex
             # Return stale data for transient errors
-            return self.data if self.data else {}
+            return self._unchanged_data()
 
         except SomeComfortConnectionError as ex:
             self._consecutive_errors += 1
@@ -240,7 +555,7 @@ class MyHoneywellCoordinator(DataUpdateCoordinator):
             )
             if self._consecutive_errors >= self._max_consecutive_errors:
                 raise UpdateFailed(f"Connection error after {self._consecutive_errors} attempts: {ex}") from ex
-            return self.data if self.data else {}
+            return self._unchanged_data()
 
         except Exception as ex:
             self._consecutive_errors += 1
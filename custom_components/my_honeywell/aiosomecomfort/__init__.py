@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import time
 import urllib.parse as urllib
 import aiohttp
 from yarl import URL
@@ -26,40 +27,41 @@ DOMAIN = "mytotalconnectcomfort.com"
 MIN_LOGIN_TIME = datetime.timedelta(minutes=10)
 MAX_LOGIN_ATTEMPTS = 3
 DEFAULT_RETRY_COUNT = 3
-RETRY_BACKOFF_BASE = 2  # seconds
+RETRY_BACKOFF_BASE = 1  # seconds, doubled per attempt before jitter
+RETRY_BACKOFF_CAP = 10  # seconds
+RETRY_DEADLINE = 30  # seconds per operation, including retries
+BREAKER_FAILURE_RATIO = 0.5
+BREAKER_MIN_CALLS = 5
+BREAKER_WINDOW = 60  # seconds
+BREAKER_OPEN_TIME = 30  # seconds
+REQUEST_RATE = 5  # requests per second, account-wide
+REQUEST_BURST = 10
+MAX_LOCATION_PAGES = 50
+DATA_CACHE_TTL = 600  # seconds
+WRITE_COALESCE_MAX_DELAY = 2  # seconds
 
 
 # ============== Exceptions ==============
 
-class SomeComfortError(Exception):
-    """SomeComfort general error class."""
-
-class ConnectionTimeout(SomeComfortError):
-    """SomeComfort Connection Timeout Error."""
-
-class ConnectionError(SomeComfortError):
-    """SomeComfort Connection Error."""
-
-class AuthError(SomeComfortError):
-    """SomeComfort Authentication Error."""
-
-class APIError(SomeComfortError):
-    """SomeComfort General API error."""
-
-class APIRateLimited(SomeComfortError):
-    """SomeComfort API Rate limited."""
-
-class SessionTimedOut(SomeComfortError):
-    """SomeComfort Session Timeout."""
-
-class ServiceUnavailable(SomeComfortError):
-    """SomeComfort Service Unavailable."""
-
-class UnexpectedResponse(SomeComfortError):
-    """SomeComfort responded with incorrect type."""
-
-class UnauthorizedError(SomeComfortError):
-    """Unauthorized response from SomeComfort."""
+from .exceptions import (
+    APIError,
+    APIRateLimited,
+    AuthError,
+    CircuitOpen,
+    ConnectionError,
+    ConnectionTimeout,
+    InvalidCredentials,
+    ServiceUnavailable,
+    SessionTimedOut,
+    SomeComfortError,
+    UnauthorizedError,
+    UnexpectedResponse,
+)
+from .breaker import CircuitBreaker
+from .coalesce import WriteCoalescer
+from .metrics import Metrics, endpoint_name
+from .ratelimit import PRIORITY_POLL, PRIORITY_WRITE, TokenBucket
+from .retry import RetryPolicy
 
 
 # ============== Client ==============
@@ -85,12 +87,48 @@ class AIOSomeComfort:
         timeout: int = 30,
         session: aiohttp.ClientSession = None,
         retry_count: int = DEFAULT_RETRY_COUNT,
+        retry_deadline: float = RETRY_DEADLINE,
+        location_page_concurrency: int = 1,
+        data_cache_ttl: float = DATA_CACHE_TTL,
+        write_coalesce_window: float = 0,
+        request_rate: float = REQUEST_RATE,
+        request_burst: int = REQUEST_BURST,
+        metrics: bool = False,
+        baseurl: str = f"https://{DOMAIN}",
     ) -> None:
         self._username = username
         self._password = password
         self._session = session
         self._timeout = timeout
-        self._retry_count = retry_count
+        self._retry_policy = RetryPolicy(
+            attempts=retry_count,
+            deadline=retry_deadline,
+            backoff_base=RETRY_BACKOFF_BASE,
+            backoff_cap=RETRY_BACKOFF_CAP,
+        )
+        self._limiter = TokenBucket(request_rate, request_burst)
+        self._metrics = Metrics() if metrics else None
+        self._breaker = CircuitBreaker(
+            failure_ratio=BREAKER_FAILURE_RATIO,
+            min_calls=BREAKER_MIN_CALLS,
+            window=BREAKER_WINDOW,
+            open_time=BREAKER_OPEN_TIME,
+        )
+        self._location_page_concurrency = max(1, location_page_concurrency)
+        self._location_page_requests = 0
+        self._data_cache_ttl = data_cache_ttl
+        self._data_cache: dict = {}
+        self._data_cache_hits = 0
+        self._data_cache_misses = 0
+        self._write_coalescer = (
+            WriteCoalescer(
+                self._submit_thermostat_settings,
+                write_coalesce_window,
+                max(write_coalesce_window, WRITE_COALESCE_MAX_DELAY),
+            )
+            if write_coalesce_window > 0
+            else None
+        )
         self._headers = {
             "X-Requested-With": "XMLHttpRequest",
             "Accept": "*/*",
@@ -98,11 +136,17 @@ class AIOSomeComfort:
             "Accept-Encoding": "gzip, deflate",
         }
         self._locations = {}
-        self._baseurl = f"https://{DOMAIN}"
+        self._baseurl = baseurl.rstrip("/")
         self._null_cookie_count = 0
         self._next_login = datetime.datetime.now(datetime.timezone.utc)
         self._counter = 1700000000000
         self._is_authenticated = False
+        self._auth_generation = 0
+        self._login_future: asyncio.Future | None = None
+        # Generation the login in _login_future was started for
+        self._login_generation: int | None = None
+        self._session_started: float | None = None
+        self._session_lifetime: float | None = None
 
     @property
     def next_login(self) -> datetime.datetime:
@@ -114,6 +158,88 @@ class AIOSomeComfort:
         """Return whether we believe we're authenticated."""
         return self._is_authenticated
 
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Retry policy shared by every request made for one operation."""
+        return self._retry_policy
+
+    @property
+    def circuit_state(self) -> str:
+        """State of the circuit breaker: closed, open or half_open."""
+        return self._breaker.state
+
+    @property
+    def circuit_open(self) -> bool:
+        """Whether requests currently fail fast without being sent."""
+        return self._breaker.is_open
+
+    @property
+    def rate_limiter_stats(self) -> dict:
+        """Queue depth and wait-time counters of the request rate limiter."""
+        return self._limiter.stats()
+
+    def metrics_snapshot(self) -> dict | None:
+        """Per-endpoint request metrics, or None when metrics are disabled."""
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot()
+
+    @property
+    def location_page_requests(self) -> int:
+        """Number of GetLocationListData requests made by the last listing."""
+        return self._location_page_requests
+
+    def export_session(self) -> dict | None:
+        """Return the auth cookie and its timing, for persisting across restarts."""
+        if not self._is_authenticated or self._session_started is None:
+            return None
+        cookie = self._session.cookie_jar.filter_cookies(URL(self._baseurl)).get(
+            AUTH_COOKIE
+        )
+        if cookie is None or not cookie.value:
+            return None
+        return {
+            "cookie": cookie.value,
+            "started": self._session_started,
+            "lifetime": self._session_lifetime,
+        }
+
+    def restore_session(
+        self, cookie: str, started: float, lifetime: float | None = None
+    ) -> bool:
+        """
+        Reuse a previously exported auth cookie instead of logging in.
+
+        No request is made here; if the server rejects the cookie, the next
+        request gets a 401 and the normal re-authentication path logs in.
+        Returns False without restoring if the cookie is already older than
+        the session lifetime we last observed.
+        """
+        age = time.time() - started
+        if lifetime is not None and age >= lifetime:
+            _LOG.debug("Saved session is %ds old, past observed lifetime", age)
+            return False
+        self._session.cookie_jar.update_cookies(
+            {AUTH_COOKIE: cookie}, response_url=URL(self._baseurl)
+        )
+        self._session_started = started
+        self._session_lifetime = lifetime
+        self._is_authenticated = True
+        _LOG.info("Restored saved session for %s (%ds old)", self._username, age)
+        return True
+
+    def _note_session_expired(self, generation: int) -> None:
+        """Remember how long the current session lasted before a 401/403.
+
+        generation is the login the rejected request was sent under; a
+        rejection of an older session says nothing about the current one.
+        """
+        if generation != self._auth_generation:
+            return
+        if self._is_authenticated and self._session_started is not None:
+            self._session_lifetime = time.time() - self._session_started
+        self._is_authenticated = False
+
     def _set_null_count(self) -> None:
         """Set null cookie count and retry timeout."""
         self._null_cookie_count += 1
@@ -140,11 +266,17 @@ class AIOSomeComfort:
             wait_time = self._next_login - datetime.datetime.now(datetime.timezone.utc)
             raise APIRateLimited(f"Rate limit on login: Waiting {wait_time}")
 
+        # Through the breaker too, so an outage doesn't turn into login POSTs
+        await self._through_breaker(self._login, url)
+
+    async def _login(self, url: URL) -> None:
+        """Send the login POST and verify the session (internal, no breaker)."""
         _LOG.debug("Attempting login for %s", self._username)
-        resp = await self._session.post(
-            url, timeout=self._timeout, headers=self._headers
+        await self._limiter.acquire(PRIORITY_WRITE)
+        resp = await self._send(
+            "post", url, timeout=self._timeout, headers=self._headers
         )
-        
+
         # Handle the malformed cookie
         cookies = resp.cookies
         if AUTH_COOKIE in cookies:
@@ -156,7 +288,7 @@ class AIOSomeComfort:
         if resp.status == 401:
             _LOG.error("Login as %s failed (401)", self._username)
             self._set_null_count()
-            raise AuthError(f"Login as {self._username} failed")
+            raise InvalidCredentials(f"Login as {self._username} failed")
 
         if resp.status != 200:
             _LOG.error("Connection error during login: %s", resp.status)
@@ -164,8 +296,12 @@ class AIOSomeComfort:
 
         # Verify login with portal redirect
         self._headers["Content-Type"] = "application/json"
-        resp2 = await self._session.get(
-            f"{self._baseurl}/portal", timeout=self._timeout, headers=self._headers
+        await self._limiter.acquire(PRIORITY_WRITE)
+        resp2 = await self._send(
+            "get",
+            f"{self._baseurl}/portal",
+            timeout=self._timeout,
+            headers=self._headers,
         )
 
         if AUTH_COOKIE in resp2.cookies and resp2.cookies[AUTH_COOKIE].value == "":
@@ -185,23 +321,112 @@ class AIOSomeComfort:
         # Success!
         self._null_cookie_count = 0
         self._is_authenticated = True
+        self._auth_generation += 1
+        self._session_started = time.time()
         _LOG.info("Successfully logged in as %s", self._username)
 
     async def ensure_authenticated(self) -> None:
         """Ensure we're authenticated, re-login if needed."""
         if not self._is_authenticated:
             _LOG.info("Not authenticated, logging in")
-            await self.login()
+            if self._login_future is None or self._login_future.done():
+                self._start_login()
+            # Shield so a cancelled caller doesn't abort the shared login
+            await asyncio.shield(self._login_future)
+
+    async def _reauthenticate(self, generation: int) -> None:
+        """
+        Log in once on behalf of every caller rejected under the same session.
+
+        generation is the login the rejected request was sent under. The
+        first caller starts a login and every later caller for the same
+        generation shares it and its outcome, a failure included, so the
+        waiters don't each try again after a failed login. A caller whose
+        request was sent before a newer login succeeded simply replays.
+        """
+        if self._login_future is None or self._login_generation != generation:
+            if generation != self._auth_generation:
+                # The 401 predates a successful login, so the session is good
+                _LOG.debug("Session already renewed by another request")
+                return
+            self._start_login()
+        elif not self._login_future.done():
+            _LOG.debug("Waiting for in-flight login")
+        await asyncio.shield(self._login_future)
+
+    def _start_login(self) -> None:
+        """Start the login shared by callers of the current generation."""
+        self._login_generation = self._auth_generation
+        self._login_future = asyncio.ensure_future(self.login())
+
+    async def _request_json(
+        self, method: str, *args, priority: int = PRIORITY_POLL, **kwargs
+    ) -> str | None:
+        """Make a JSON API request (internal, no retry) through the breaker.
+
+        Waits for a rate-limiter token at the given priority first. Raises
+        CircuitOpen without sending anything while the breaker is open.
+        """
+        await self._limiter.acquire(priority)
+        return await self._through_breaker(
+            self._send_request_json, method, *args, **kwargs
+        )
 
-    async def _request_json(self, method: str, *args, **kwargs) -> str | None:
-        """Make a JSON API request (internal, no retry)."""
+    async def _through_breaker(self, request, *args, **kwargs):
+        """
+        Await request(*args, **kwargs) if the circuit breaker lets it through.
+
+        The outcome is recorded under the breaker state the request was let
+        through in. 5xx, redirects and transport errors count as failures;
+        any other response shows the portal is up.
+        """
+        ticket = self._breaker.allow()
+        try:
+            result = await request(*args, **kwargs)
+        except (
+            ServiceUnavailable,
+            ConnectionError,
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+        ):
+            self._breaker.record(ticket, success=False)
+            raise
+        except SomeComfortError:
+            self._breaker.record(ticket, success=True)
+            raise
+        except BaseException:
+            self._breaker.abandon(ticket)
+            raise
+        self._breaker.record(ticket, success=True)
+        return result
+
+    async def _send(self, method: str, url, **kwargs) -> aiohttp.ClientResponse:
+        """Send one HTTP request, recording it when metrics are enabled."""
+        metrics = self._metrics
+        if metrics is None:
+            return await getattr(self._session, method)(url, **kwargs)
+
+        endpoint = endpoint_name(method, url)
+        started = metrics.request_started(endpoint)
+        try:
+            resp = await getattr(self._session, method)(url, **kwargs)
+            # Read the body here so its size is known; json() reuses it
+            body = await resp.read()
+        except BaseException as ex:
+            metrics.request_finished(endpoint, started, type(ex).__name__, 0)
+            raise
+        metrics.request_finished(endpoint, started, resp.status, len(body))
+        return resp
+
+    async def _send_request_json(self, method: str, *args, **kwargs) -> str | None:
+        """Send one JSON API request and map its response."""
         if "timeout" not in kwargs:
             kwargs["timeout"] = self._timeout
         kwargs["headers"] = self._headers
-        
-        resp: aiohttp.ClientResponse = await getattr(self._session, method)(
-            *args, **kwargs
-        )
+        # Session the request is sent under, in case a login finishes meanwhile
+        generation = self._auth_generation
+
+        resp = await self._send(method, *args, **kwargs)
 
         # Handle malformed cookie
         cookies = resp.cookies
@@ -213,7 +438,10 @@ class AIOSomeComfort:
 
         req = args[0].replace(self._baseurl, "")
         
-        if resp.status == 200 and resp.content_type in ["application/json", "application/octet-stream"]:
+        if resp.status == 200 and resp.content_type in [
+            "application/json",
+            "application/octet-stream",
+        ]:
             self._null_cookie_count = 0
             if resp.content_type == "application/json":
                 return await resp.json()
@@ -221,12 +449,12 @@ class AIOSomeComfort:
 
         if resp.status == 401:
             _LOG.warning("401 Unauthorized - session likely expired")
-            self._is_authenticated = False
+            self._note_session_expired(generation)
             raise UnauthorizedError("401 Error (session expired)")
 
         if resp.status == 403:
             _LOG.warning("403 Forbidden - may be rate limited or session expired")
-            self._is_authenticated = False
+            self._note_session_expired(generation)
             raise UnauthorizedError("403 Error (forbidden)")
 
         if resp.status in [500, 502, 503] or len(resp.history) > 0:
@@ -240,61 +468,76 @@ class AIOSomeComfort:
         self, 
         method: str, 
         *args, 
-        retry_count: int | None = None,
         **kwargs
     ) -> str | None:
         """
         Make a JSON API request with automatic retry and re-authentication.
         
-        This is the KEY IMPROVEMENT over the original library.
+        This is the KEY IMPROVEMENT over the original library. Attempts,
+        backoff (full jitter) and the overall deadline come from the retry
+        policy; the budget is shared with any enclosing operation, such as
+        the rest of a device refresh, and per-request timeouts are clipped to
+        what is left of it.
         """
-        retries = retry_count if retry_count is not None else self._retry_count
-        last_error = None
-
-        for attempt in range(retries):
-            try:
-                await self.ensure_authenticated()
-                return await self._request_json(method, *args, **kwargs)
-                
-            except UnauthorizedError as e:
-                _LOG.warning("Auth error on attempt %d/%d, re-authenticating: %s", 
-                           attempt + 1, retries, e)
-                self._is_authenticated = False
+        last_error: Exception | None = None
+        attempt = 0
+
+        with self._retry_policy.operation() as budget:
+            while budget.start_attempt(retry=attempt > 0):
+                attempt += 1
+                # Fail fast, before any login, while the portal is down
+                self._breaker.check()
+                attempt_kwargs = kwargs
+                if "timeout" not in kwargs:
+                    attempt_kwargs = {
+                        **kwargs,
+                        "timeout": min(self._timeout, budget.remaining),
+                    }
+                generation = self._auth_generation
                 try:
-                    await self.login()
-                except (AuthError, APIRateLimited) as auth_err:
-                    last_error = auth_err
-                    if attempt < retries - 1:
-                        backoff = RETRY_BACKOFF_BASE ** attempt
-                        _LOG.info("Auth failed, waiting %ds before retry", backoff)
-                        await asyncio.sleep(backoff)
+                    await self.ensure_authenticated()
+                    generation = self._auth_generation
+                    return await self._request_json(method, *args, **attempt_kwargs)
+
+                except UnauthorizedError as e:
+                    _LOG.warning("Auth error on attempt %d, re-authenticating: %s",
+                               attempt, e)
+                    last_error = e
+                    # A failed login is final for this request: every caller
+                    # rejected with it shares that one login and its error
+                    await self._reauthenticate(generation)
+                    # Replay straight away with the new session
+                    if self._metrics is not None:
+                        self._metrics.retried(endpoint_name(method, args[0]))
                     continue
-                    
-            except ServiceUnavailable as e:
-                _LOG.warning("Service unavailable on attempt %d/%d: %s",
-                           attempt + 1, retries, e)
-                last_error = e
-                if attempt < retries - 1:
-                    backoff = RETRY_BACKOFF_BASE ** attempt
-                    _LOG.info("Waiting %ds before retry", backoff)
-                    await asyncio.sleep(backoff)
-                continue
-                
-            except ConnectionError as e:
-                _LOG.warning("Connection error on attempt %d/%d: %s",
-                           attempt + 1, retries, e)
-                last_error = e
-                if attempt < retries - 1:
-                    backoff = RETRY_BACKOFF_BASE ** attempt
-                    _LOG.info("Waiting %ds before retry", backoff)
-                    await asyncio.sleep(backoff)
-                continue
-
-        # All retries exhausted
-        _LOG.error("All %d retry attempts failed", retries)
+
+                except CircuitOpen:
+                    raise
+
+                except (ServiceUnavailable, ConnectionError) as e:
+                    _LOG.warning("Request failed on attempt %d: %s",
+                               attempt, e)
+                    last_error = e
+
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    _LOG.warning("Connection error on attempt %d: %s",
+                               attempt, e)
+                    last_error = ConnectionError(f"Connection error: {e!r}")
+                    last_error.__cause__ = e
+
+                delay = budget.backoff()
+                if delay is None:
+                    break
+                if self._metrics is not None:
+                    self._metrics.retried(endpoint_name(method, args[0]))
+                _LOG.info("Waiting %.1fs before retry", delay)
+                await asyncio.sleep(delay)
+
+        # Budget exhausted
+        _LOG.error("Request failed after %d attempts", attempt)
         if last_error:
             raise last_error
-        raise SomeComfortError("Request failed after all retries")
+        raise SomeComfortError("Retry budget exhausted before the request")
 
     async def _get_json(self, *args, **kwargs) -> str | None:
         """GET request with retry."""
@@ -304,32 +547,65 @@ class AIOSomeComfort:
         """POST request with retry."""
         return await self._request_json_with_retry("post", *args, **kwargs)
 
-    async def _get_locations(self) -> list:
-        """Get all locations for the account."""
-        json_responses: list = []
+    async def _get_location_page(self, page: int) -> list:
+        """Fetch one page of the location list, with retry."""
         url = f"{self._baseurl}/portal/Location/GetLocationListData/"
-        
-        for page in range(1, 5):
-            params = {"page": page, "filter": ""}
-            # Use internal method without retry for pagination
-            try:
-                await self.ensure_authenticated()
-                resp = await self._session.post(
-                    url, params=params, headers=self._headers, timeout=self._timeout
-                )
-                if resp.content_type == "application/json":
-                    json_responses.extend(await resp.json())
-                    
-                cookies = resp.cookies
-                if AUTH_COOKIE in cookies:
-                    cookies[AUTH_COOKIE]["expires"] = ''
-                    self._session.cookie_jar.update_cookies(
-                        cookies=cookies, response_url=URL(resp.host)
-                    )
-            except Exception as e:
-                _LOG.warning("Error fetching location page %d: %s", page, e)
-                break
-                
+        self._location_page_requests += 1
+        result = await self._post_json(url, params={"page": page, "filter": ""})
+        return result if isinstance(result, list) else []
+
+    async def _get_locations(self) -> list:
+        """
+        Get all locations for the account.
+
+        Pages are read until one comes back empty or shorter than the first
+        page. Every page is retried; if one still fails the error is raised,
+        so callers never get a partial listing. With
+        location_page_concurrency > 1, once page 2 also comes back full the
+        remaining pages are requested in concurrent batches and anything
+        past the end is dropped.
+        """
+        await self.ensure_authenticated()
+        self._location_page_requests = 0
+
+        # Page 1 errors propagate: there is nothing useful to return
+        first = await self._get_location_page(1)
+        json_responses: list = list(first)
+        page_size = len(first)
+        page = 2
+        done = page_size == 0
+
+        while not done and page <= MAX_LOCATION_PAGES:
+            # Only fan out once the account has proven to span several pages
+            batch_size = 1 if page == 2 else self._location_page_concurrency
+            last = min(page + batch_size, MAX_LOCATION_PAGES + 1)
+            batch = range(page, last)
+            results = await asyncio.gather(
+                *(self._get_location_page(number) for number in batch),
+                return_exceptions=True,
+            )
+            for number, result in zip(batch, results):
+                # A missing page would silently drop its devices, so fail the
+                # whole listing once the page's retries are used up
+                if isinstance(result, BaseException):
+                    _LOG.warning("Error fetching location page %d: %s", number, result)
+                    raise result
+                json_responses.extend(result)
+                if len(result) < page_size:
+                    done = True
+                    break
+            page = last
+
+        if not done:
+            _LOG.warning(
+                "Stopped listing locations at the %d page limit", MAX_LOCATION_PAGES
+            )
+
+        _LOG.debug(
+            "Listed %d locations in %d page requests",
+            len(json_responses),
+            self._location_page_requests,
+        )
         return json_responses if json_responses else None
 
     async def get_thermostat_data(self, thermostat_id: str) -> str:
@@ -338,15 +614,59 @@ class AIOSomeComfort:
         self._counter += 1
         return await self._get_json(url)
 
-    async def get_data(self, thermostat_id: str) -> str:
-        """Get device total data structure with retry."""
+    async def get_data(self, thermostat_id: str, use_cache: bool = True) -> str:
+        """Get device total data structure with retry.
+
+        Results are cached for data_cache_ttl seconds; the humidity setters
+        invalidate the entry for their device.
+        """
+        if use_cache:
+            cached = self._data_cache.get(thermostat_id)
+            if cached is not None and time.monotonic() < cached[0]:
+                self._data_cache_hits += 1
+                return cached[1]
+        self._data_cache_misses += 1
         url = f"{self._baseurl}/portal/Device/Menu/GetData?deviceID={thermostat_id}"
-        return await self._post_json(url)
+        result = await self._post_json(url)
+        if result is not None and self._data_cache_ttl > 0:
+            self._data_cache[thermostat_id] = (
+                time.monotonic() + self._data_cache_ttl,
+                result,
+            )
+        return result
+
+    def invalidate_data(self, thermostat_id: str) -> None:
+        """Drop the cached GetData result for a device."""
+        self._data_cache.pop(thermostat_id, None)
+
+    @property
+    def data_cache_stats(self) -> dict:
+        """Hit/miss counters, hit rate and size of the GetData cache."""
+        lookups = self._data_cache_hits + self._data_cache_misses
+        return {
+            "hits": self._data_cache_hits,
+            "misses": self._data_cache_misses,
+            "hit_rate": self._data_cache_hits / lookups if lookups else None,
+            "size": len(self._data_cache),
+        }
 
     async def set_thermostat_settings(
         self, thermostat_id: str, settings: dict[str, str]
     ) -> None:
-        """Set thermostat settings with retry."""
+        """Set thermostat settings with retry.
+
+        With a write_coalesce_window, writes to the same device that arrive
+        within the window are merged and sent as one request.
+        """
+        if self._write_coalescer is not None:
+            await self._write_coalescer.submit(thermostat_id, settings)
+        else:
+            await self._submit_thermostat_settings(thermostat_id, settings)
+
+    async def _submit_thermostat_settings(
+        self, thermostat_id: str, settings: dict[str, str]
+    ) -> None:
+        """POST one SubmitControlScreenChanges request."""
         data = {
             "DeviceID": thermostat_id,
             "SystemSwitch": None,
@@ -361,23 +681,30 @@ class AIOSomeComfort:
         data.update(settings)
         
         url = f"{self._baseurl}/portal/Device/SubmitControlScreenChanges"
-        result = await self._post_json(url, json=data)
+        result = await self._post_json(url, json=data, priority=PRIORITY_WRITE)
         
         if result is None or result.get("success") != 1:
             raise APIError("API rejected thermostat settings")
 
     @_convert_errors
-    async def discover(self) -> None:
-        """Discover devices on the account with retry on failure."""
+    async def discover(self, hydrate: bool = True) -> None:
+        """Discover devices on the account with retry on failure.
+
+        With hydrate=False only the location list is fetched; devices have
+        no data until their first refresh().
+        """
         from .location import Location  # Avoid circular import
         
-        await self.ensure_authenticated()
-        raw_locations = await self._get_locations()
-        
+        # One retry budget for every page, re-logins included
+        with self._retry_policy.operation():
+            raw_locations = await self._get_locations()
+
         if raw_locations is not None:
             for raw_location in raw_locations:
                 try:
-                    location = await Location.from_api_response(self, raw_location)
+                    location = await Location.from_api_response(
+                        self, raw_location, hydrate=hydrate
+                    )
                     self._locations[location.locationid] = location
                 except KeyError as ex:
                     _LOG.exception(
@@ -385,6 +712,30 @@ class AIOSomeComfort:
                         raw_location.get("LocationID", "unknown"), ex.args[0]
                     )
 
+    @_convert_errors
+    async def get_device_ids(self) -> set:
+        """Return the DeviceIDs on the account from the location list alone."""
+        with self._retry_policy.operation():
+            raw_locations = await self._get_locations()
+        return {
+            device["DeviceID"]
+            for raw_location in raw_locations or []
+            for device in raw_location.get("Devices", [])
+        }
+
+    def snapshot(self) -> list[dict]:
+        """Return the discovered locations and device data for persisting."""
+        return [location.snapshot() for location in self._locations.values()]
+
+    def restore_snapshot(self, snapshot: list[dict]) -> None:
+        """Recreate locations and devices from snapshot() without discovery."""
+        from .location import Location  # Avoid circular import
+
+        self._locations = {}
+        for raw_location in snapshot:
+            location = Location.from_snapshot(self, raw_location)
+            self._locations[location.locationid] = location
+
     @property
     def locations_by_id(self) -> dict:
         """A dict of all locations indexed by id."""
@@ -0,0 +1,137 @@
+"""Circuit breaker guarding requests to the TCC portal."""
+from __future__ import annotations
+from collections import deque
+import logging
+import time
+from typing import Callable
+
+from .exceptions import CircuitOpen
+
+_LOG = logging.getLogger("somecomfort")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stop sending requests while the portal is failing.
+
+    Closed: requests flow and their outcomes are kept for `window` seconds.
+    Once at least `min_calls` outcomes are recorded and `failure_ratio` of
+    them are failures, the breaker opens.
+
+    Open: every request fails fast with CircuitOpen for `open_time` seconds.
+
+    Half-open: a single probe request is let through. Success closes the
+    breaker; failure opens it again for another `open_time`.
+
+    allow() hands out a ticket naming the state period the request was let
+    through in; record() and abandon() ignore outcomes of requests from an
+    earlier period, so a slow request sent while closed can't count as the
+    probe.
+    """
+
+    def __init__(
+        self,
+        failure_ratio: float,
+        min_calls: int,
+        window: float,
+        open_time: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_ratio = failure_ratio
+        self._min_calls = min_calls
+        self._window = window
+        self._open_time = open_time
+        self._clock = clock
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        # Bumped on every state change; see allow()
+        self._generation = 0
+
+    @property
+    def state(self) -> str:
+        """One of closed, open or half_open."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self._open_time:
+            self._state = HALF_OPEN
+            self._generation += 1
+            _LOG.info("Circuit breaker half-open, allowing a probe request")
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests would currently fail fast."""
+        state = self.state
+        return state == OPEN or (state == HALF_OPEN and self._probing)
+
+    def check(self) -> None:
+        """Raise CircuitOpen if a request would not be let through now."""
+        if self.is_open:
+            raise CircuitOpen("TCC portal circuit breaker is open")
+
+    def allow(self) -> int:
+        """
+        Let a request through or raise CircuitOpen; claims the probe when half-open.
+
+        Returns the ticket to pass to record() or abandon() for this request.
+        """
+        self.check()
+        if self._state == HALF_OPEN:
+            self._probing = True
+        return self._generation
+
+    def record(self, ticket: int, success: bool) -> None:
+        """Record the outcome of a request let through by allow()."""
+        if ticket != self._generation:
+            _LOG.debug("Ignoring outcome of a request from an earlier breaker state")
+            return
+        if self._state == HALF_OPEN:
+            self._probing = False
+            if success:
+                _LOG.info("Probe succeeded, circuit breaker closed")
+                self._reset()
+            else:
+                _LOG.warning("Probe failed, circuit breaker open again")
+                self._open()
+            return
+
+        now = self._clock()
+        self._outcomes.append((now, success))
+        if not success:
+            self._failures += 1
+        while self._outcomes and now - self._outcomes[0][0] > self._window:
+            if not self._outcomes.popleft()[1]:
+                self._failures -= 1
+        if (
+            self._state == CLOSED
+            and len(self._outcomes) >= self._min_calls
+            and self._failures >= self._failure_ratio * len(self._outcomes)
+        ):
+            _LOG.warning(
+                "Circuit breaker open after %d/%d failed requests, pausing for %ss",
+                self._failures,
+                len(self._outcomes),
+                self._open_time,
+            )
+            self._open()
+
+    def abandon(self, ticket: int) -> None:
+        """Forget a request let through by allow() that had no outcome (cancelled)."""
+        if ticket == self._generation and self._state == HALF_OPEN:
+            self._probing = False
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._generation += 1
+        self._opened_at = self._clock()
+
+    def _reset(self) -> None:
+        self._state = CLOSED
+        self._generation += 1
+        self._outcomes.clear()
+        self._failures = 0
@@ -0,0 +1,82 @@
+"""Coalesce bursts of thermostat setting writes into single POSTs."""
+from __future__ import annotations
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+_LOG = logging.getLogger("somecomfort")
+
+
+class _PendingWrite:
+    """Settings waiting to be sent for one device."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.settings: dict = {}
+        self.future: asyncio.Future = loop.create_future()
+        self.first = loop.time()
+        self.handle: asyncio.TimerHandle | None = None
+        self.writes = 0
+
+
+class WriteCoalescer:
+    """
+    Merge setting writes for the same device into one request.
+
+    Each submit() restarts a short debounce window; when it expires (or
+    max_delay after the first write, whichever is sooner) the merged settings
+    are sent once. Later values win for keys written more than once. Every
+    caller awaits the same result, so all see the merged write's outcome.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, dict], Awaitable[None]],
+        window: float,
+        max_delay: float,
+    ) -> None:
+        self._send = send
+        self._window = window
+        self._max_delay = max_delay
+        self._pending: dict[str, _PendingWrite] = {}
+
+    async def submit(self, thermostat_id: str, settings: dict) -> None:
+        """Queue settings for a device and wait until the merged write lands."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(thermostat_id)
+        if pending is None:
+            pending = self._pending[thermostat_id] = _PendingWrite(loop)
+        pending.settings.update(settings)
+        pending.writes += 1
+
+        if pending.handle is not None:
+            pending.handle.cancel()
+        when = min(loop.time() + self._window, pending.first + self._max_delay)
+        pending.handle = loop.call_at(when, self._flush, thermostat_id)
+
+        # Shield so a cancelled caller doesn't cancel the write for the others
+        await asyncio.shield(pending.future)
+
+    def _flush(self, thermostat_id: str) -> None:
+        """Send the merged settings for a device."""
+        pending = self._pending.pop(thermostat_id)
+        if pending.writes > 1:
+            _LOG.debug(
+                "Coalesced %d writes to %s into one: %s",
+                pending.writes,
+                thermostat_id,
+                pending.settings,
+            )
+        task = asyncio.ensure_future(self._send(thermostat_id, pending.settings))
+        task.add_done_callback(lambda done: _resolve(pending.future, done))
+
+
+def _resolve(future: asyncio.Future, task: asyncio.Future) -> None:
+    """Copy a finished task's outcome onto the shared future."""
+    if future.done():
+        return
+    if task.cancelled():
+        future.cancel()
+    elif (exc := task.exception()) is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(task.result())
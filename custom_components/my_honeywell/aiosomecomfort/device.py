@@ -1,9 +1,14 @@
 from __future__ import annotations
 import copy
+import dataclasses
 import datetime
 import logging
+import math
 import time
+from types import MappingProxyType
+from typing import Any, Mapping
 from .exceptions import *
+from .ratelimit import PRIORITY_WRITE
 
 FAN_MODES = ["auto", "on", "circulate", "follow schedule"]
 SYSTEM_MODES = ["emheat", "heat", "off", "cool", "auto", "auto"]
@@ -11,6 +16,7 @@ HOLD_TYPES = ["schedule", "temporary", "permanent"]
 EQUIPMENT_OUTPUT_STATUS = ["off/fan", "heat", "cool"]
 _LOG = logging.getLogger("somecomfort")
 HUMIDITY_STEP = 5 
+PENDING_WRITE_TIMEOUT = 120  # seconds
 
 
 def _hold_quarter_hours(deadline):
@@ -28,6 +34,137 @@ def _humidity_step(value:int) -> int:
     return HUMIDITY_STEP * round (value/HUMIDITY_STEP)
 
 
+def _read_only(value: Any) -> Any:
+    """Wrap API data in read-only views.
+
+    Dicts of plain values are wrapped as-is, so the view shares (and follows)
+    the underlying dict; only containers holding nested dicts or lists are
+    copied, one level at a time.
+    """
+    if isinstance(value, dict):
+        nested = [
+            key for key, item in value.items() if isinstance(item, (dict, list))
+        ]
+        if not nested:
+            return MappingProxyType(value)
+        value = dict(value)
+        for key in nested:
+            value[key] = _read_only(value[key])
+        return MappingProxyType(value)
+    if isinstance(value, list):
+        return tuple(_read_only(item) for item in value)
+    return value
+
+
+def _hold(status, period) -> bool | datetime.time | None:
+    """Decode a Status/NextPeriod pair; None if the status is unknown."""
+    try:
+        hold = HOLD_TYPES[status]
+    except (IndexError, TypeError):
+        return None
+    if hold == "schedule":
+        return False
+    if hold == "permanent":
+        return True
+    try:
+        return _hold_deadline(period)
+    except TypeError:
+        return None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DeviceState:
+    """Device values parsed once per refresh so properties are plain reads.
+
+    Fields are None where the payload lacks them. Unknown enum values keep
+    their raw index in the *_index/*_status fields for error messages.
+    """
+
+    current_temperature: float | None = None
+    setpoint_heat: float | None = None
+    setpoint_cool: float | None = None
+    temperature_unit: str | None = None
+    system_mode: str | None = None
+    system_mode_index: int | None = None
+    has_fan: bool = False
+    fan_running: bool = False
+    fan_mode: str | None = None
+    fan_mode_index: int | None = None
+    hold_heat: bool | datetime.time | None = None
+    hold_heat_status: int | None = None
+    hold_cool: bool | datetime.time | None = None
+    hold_cool_status: int | None = None
+    equipment_output_status: str | None = None
+    current_humidity: float | None = None
+    outdoor_temperature: float | None = None
+    outdoor_humidity: float | None = None
+
+    @classmethod
+    def from_data(cls, data: dict | None) -> DeviceState:
+        """Parse a latestData payload."""
+        if not data:
+            return cls()
+        ui_data = data.get("uiData") or {}
+        fan_data = data.get("fanData") or {}
+        has_fan = bool(data.get("hasFan"))
+        fan_running = bool(has_fan and fan_data.get("fanIsRunning"))
+
+        system_mode_index = ui_data.get("SystemSwitchPosition")
+        try:
+            system_mode = SYSTEM_MODES[system_mode_index]
+        except (IndexError, TypeError):
+            system_mode = None
+
+        fan_mode_index = fan_data.get("fanMode")
+        try:
+            fan_mode = FAN_MODES[fan_mode_index]
+        except (IndexError, TypeError):
+            fan_mode = None
+
+        output = ui_data.get("EquipmentOutputStatus")
+        if output in (0, None):
+            equipment_output_status = "fan" if fan_running else "off"
+        else:
+            try:
+                equipment_output_status = EQUIPMENT_OUTPUT_STATUS[output]
+            except (IndexError, TypeError):
+                equipment_output_status = None
+
+        return cls(
+            current_temperature=ui_data.get("DispTemperature"),
+            setpoint_heat=ui_data.get("HeatSetpoint"),
+            setpoint_cool=ui_data.get("CoolSetpoint"),
+            temperature_unit=ui_data.get("DisplayUnits"),
+            system_mode=system_mode,
+            system_mode_index=system_mode_index,
+            has_fan=has_fan,
+            fan_running=fan_running,
+            fan_mode=fan_mode,
+            fan_mode_index=fan_mode_index,
+            hold_heat=_hold(ui_data.get("StatusHeat"), ui_data.get("HeatNextPeriod")),
+            hold_heat_status=ui_data.get("StatusHeat"),
+            hold_cool=_hold(ui_data.get("StatusCool"), ui_data.get("CoolNextPeriod")),
+            hold_cool_status=ui_data.get("StatusCool"),
+            equipment_output_status=equipment_output_status,
+            current_humidity=(
+                ui_data.get("IndoorHumidity")
+                if ui_data.get("IndoorHumiditySensorAvailable")
+                and ui_data.get("IndoorHumiditySensorNotFault")
+                else None
+            ),
+            outdoor_temperature=(
+                ui_data.get("OutdoorTemperature")
+                if ui_data.get("OutdoorTemperatureAvailable")
+                else None
+            ),
+            outdoor_humidity=(
+                ui_data.get("OutdoorHumidity")
+                if ui_data.get("OutdoorHumidityAvailable")
+                else None
+            ),
+        )
+
+
 class Device(object):
     """Device class for Honeywell device."""
 
@@ -35,39 +172,173 @@ class Device(object):
         self._client = client
         self._location = location
         self._data = {}
+        self._state = DeviceState()
         self._gdata = {}
+        self._views = {}
         self._last_refresh = 0
         self._deviceid = None
         self._macid = None
         self._name = None
         self._alive = None
         self._commslost = None
+        # (section, key) -> (written value, value before the write, deadline)
+        self._pending = {}
 
     @classmethod
-    async def from_location_response(cls, client, location, response) -> Device:
-        """Extract device from location response."""
+    async def from_location_response(
+        cls, client, location, response, hydrate: bool = True
+    ) -> Device:
+        """Extract device from location response.
+
+        With hydrate=False no request is made; the device has no data until
+        its first refresh().
+        """
         self = cls(client, location)
         self._deviceid = response.get("DeviceID")
         self._macid = response.get("MacID")
         self._name = response.get("Name")
-        await self.refresh()
+        if hydrate:
+            await self.refresh()
         return self
 
+    @classmethod
+    def from_snapshot(cls, client, location, snapshot) -> Device:
+        """Rebuild a device from a snapshot() without any API calls."""
+        self = cls(client, location)
+        self._deviceid = snapshot["DeviceID"]
+        self._macid = snapshot.get("MacID")
+        self._name = snapshot.get("Name")
+        self._alive = snapshot.get("deviceLive")
+        self._commslost = snapshot.get("communicationLost")
+        self._data = snapshot.get("latestData") or {}
+        self._state = DeviceState.from_data(self._data)
+        self._gdata = snapshot.get("gdata") or {}
+        return self
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable copy of the device's last known state."""
+        return {
+            "DeviceID": self._deviceid,
+            "MacID": self._macid,
+            "Name": self._name,
+            "deviceLive": self._alive,
+            "communicationLost": self._commslost,
+            "latestData": copy.deepcopy(self._data),
+            "gdata": copy.deepcopy(self._gdata),
+        }
+
     async def refresh(self) -> None:
         """Refresh the Honeywell device data."""
         if self._client.next_login > datetime.datetime.now(datetime.timezone.utc):
              raise APIRateLimited(f"Rate limit on login: Waiting {self._client.next_login-datetime.datetime.now(datetime.timezone.utc)}")
-        data = await self._client.get_thermostat_data(self.deviceid)
-        _LOG.debug("Refresh data %s", data)
-        if data is not None:
-            if not data.get("success"):
-                _LOG.error("API reported failure to query device %s", self.deviceid)
-            self._alive = data.get("deviceLive")
-            self._commslost = data.get("communicationLost")
-            self._data = data.get("latestData")
-            if not self._gdata or self._gdata.get("Humidifier") or self._gdata.get("Dehumidifier"):
-                self._gdata = await self._client.get_data(self.deviceid)
-            self._last_refresh = time.time()
+        # One retry budget for both requests of the refresh
+        with self._client.retry_policy.operation():
+            data = await self._client.get_thermostat_data(self.deviceid)
+            _LOG.debug("Refresh data %s", data)
+            if data is not None:
+                if not data.get("success"):
+                    _LOG.error("API reported failure to query device %s", self.deviceid)
+                self._alive = data.get("deviceLive")
+                self._commslost = data.get("communicationLost")
+                self._data = data.get("latestData")
+                self._apply_pending()
+                self._state = DeviceState.from_data(self._data)
+                # Served from the client's TTL cache between humidity changes
+                if not self._gdata or self._gdata.get("Humidifier") or self._gdata.get("Dehumidifier"):
+                    self._gdata = await self._client.get_data(self.deviceid)
+                self._views = {}
+                self._last_refresh = time.time()
+
+    async def _write_settings(
+        self, settings: dict, section: str, updates: dict
+    ) -> None:
+        """Send thermostat settings, showing `updates` locally from now on.
+
+        Applying the new values before the request lets writes that are
+        coalesced with this one compute from them (e.g. deadband). They are
+        kept over polled values until the server reports them or
+        PENDING_WRITE_TIMEOUT passes. On failure they are rolled back, unless
+        a later write has changed them since: to an earlier write of the same
+        key the server already accepted, otherwise to the server's value. An
+        earlier write still waiting on its request was coalesced into this
+        one, so it failed with it.
+        """
+        target = self._data[section]
+        # Earlier unconfirmed writes of these keys; their previous is still
+        # the last value the server reported, so a later write keeps it
+        replaced = {
+            (section, key): self._pending.get((section, key)) for key in updates
+        }
+        entries = {
+            (section, key): (
+                value,
+                replaced[(section, key)][1]
+                if replaced[(section, key)] is not None
+                else target.get(key),
+                float("inf"),
+            )
+            for key, value in updates.items()
+        }
+        self._pending.update(entries)
+        target.update(updates)
+        self._state = DeviceState.from_data(self._data)
+        try:
+            await self._client.set_thermostat_settings(self.deviceid, settings)
+        except BaseException:
+            target = self._data[section]
+            for pending_key, entry in entries.items():
+                if self._pending.get(pending_key) is not entry:
+                    continue
+                earlier = replaced[pending_key]
+                if earlier is not None and math.isfinite(earlier[2]):
+                    self._pending[pending_key] = earlier
+                    target[pending_key[1]] = earlier[0]
+                else:
+                    del self._pending[pending_key]
+                    target[pending_key[1]] = entry[1]
+            self._state = DeviceState.from_data(self._data)
+            raise
+
+        deadline = time.monotonic() + PENDING_WRITE_TIMEOUT
+        for pending_key, (value, previous, _) in entries.items():
+            if self._pending.get(pending_key) is entries[pending_key]:
+                self._pending[pending_key] = (value, previous, deadline)
+
+    def _apply_pending(self) -> None:
+        """Overlay unconfirmed writes on freshly polled data."""
+        if not self._pending or not self._data:
+            return
+        now = time.monotonic()
+        for (section, key), (value, previous, deadline) in list(self._pending.items()):
+            target = self._data.get(section)
+            if target is None:
+                continue
+            polled = target.get(key)
+            if polled == value:
+                del self._pending[(section, key)]
+            elif polled != previous:
+                # Changed elsewhere (e.g. at the thermostat) since our write
+                _LOG.info(
+                    "%s %s changed to %s on the server, dropping local %s",
+                    self, key, polled, value,
+                )
+                del self._pending[(section, key)]
+            elif now >= deadline:
+                _LOG.warning(
+                    "%s did not confirm %s=%s within %ss, server still reports %s",
+                    self, key, value, PENDING_WRITE_TIMEOUT, polled,
+                )
+                del self._pending[(section, key)]
+            else:
+                _LOG.debug(
+                    "%s keeping pending %s=%s over polled %s", self, key, value, polled
+                )
+                target[key] = value
+
+    @property
+    def is_hydrated(self) -> bool:
+        """Whether device data has been loaded by refresh() or a snapshot."""
+        return bool(self._data)
 
     @property
     def deviceid(self) -> str:
@@ -92,20 +363,15 @@ class Device(object):
     @property
     def fan_running(self) -> bool:
         """Returns a boolean indicating the current state of the fan"""
-        if self._data.get("hasFan"):
-            return self._data["fanData"]["fanIsRunning"]
-        return False
+        return self._state.fan_running
 
     @property
     def fan_mode(self) -> str | None:
         """Returns one of FAN_MODES indicating the current setting"""
-        try:
-            return FAN_MODES[self._data["fanData"]["fanMode"]]
-        except (KeyError, TypeError, IndexError):
-            if self._data["hasFan"]:
-                raise APIError(f'Unknown fan mode {self._data["fanData"]["fanMode"]}')
-            else:
-                return None
+        state = self._state
+        if state.fan_mode is None and state.has_fan:
+            raise APIError(f"Unknown fan mode {state.fan_mode_index}")
+        return state.fan_mode
 
     async def set_fan_mode(self, mode) -> None:
         """Set the fan mode async."""
@@ -117,20 +383,17 @@ class Device(object):
         key = f"fanMode{mode.title()}Allowed"
         if not self._data["fanData"][key]:
             raise SomeComfortError(f"Device does not support {mode}")
-        await self._client.set_thermostat_settings(
-            self.deviceid, {"FanMode": mode_index}
+        await self._write_settings(
+            {"FanMode": mode_index}, "fanData", {"fanMode": mode_index}
         )
-        self._data["fanData"]["fanMode"] = mode_index
 
     @property
     def system_mode(self) -> str:
         """Returns one of SYSTEM_MODES indicating the current setting"""
-        try:
-            return SYSTEM_MODES[self._data["uiData"]["SystemSwitchPosition"]]
-        except KeyError as exc:
-            raise APIError(
-                'Unknown system mode {self._data["uiData"]["SystemSwitchPosition"]}'
-            ) from exc
+        state = self._state
+        if state.system_mode is None:
+            raise APIError(f"Unknown system mode {state.system_mode_index}")
+        return state.system_mode
 
     async def set_system_mode(self, mode) -> None:
         """Async set the system mode."""
@@ -147,90 +410,83 @@ class Device(object):
                 raise SomeComfortError(f"Device does not support {mode}")
         except KeyError as exc:
             raise APIError(f"Unknown Key: {key}") from exc
-        await self._client.set_thermostat_settings(
-            self.deviceid, {"SystemSwitch": mode_index}
+        await self._write_settings(
+            {"SystemSwitch": mode_index}, "uiData", {"SystemSwitchPosition": mode_index}
         )
-        self._data["uiData"]["SystemSwitchPosition"] = mode_index
 
     @property
     def setpoint_cool(self) -> float:
         """The target temperature when in cooling mode"""
-        return self._data["uiData"]["CoolSetpoint"]
+        return self._state.setpoint_cool
 
     async def set_setpoint_cool(self, temp) -> None:
         """Async set the target temperature when in cooling mode"""
-        lower = self._data["uiData"]["CoolLowerSetptLimit"]
-        upper = self._data["uiData"]["CoolUpperSetptLimit"]        
-        deadband = self._data["uiData"]["Deadband"]
-        heatsp = self._data["uiData"]["HeatSetpoint"]
-
-        if temp > upper or temp < lower:
-            raise SomeComfortError(f"Setpoint outside range {lower}-{upper}")
-        data = {"CoolSetpoint": temp}
-
-        if deadband > 0 and (heatsp + deadband) >= temp:
-            data.update({"HeatSetpoint": temp-deadband})
-        else:
-            data.update({"HeatSetpoint": heatsp})
-        if not self._get_hold("Heat") and not self._get_hold("Cool"):
-            data.update( {
-                    "StatusCool": HOLD_TYPES.index("temporary"),
-                    "StatusHeat": HOLD_TYPES.index("temporary"),
-            })
-
-        await self._client.set_thermostat_settings(
-            self.deviceid, data
-        )
-        self._data["uiData"]["CoolSetpoint"] = temp
+        await self.set_setpoints(cool=temp)
 
     @property
     def setpoint_heat(self) -> float:
         """The target temperature when in heating mode"""
-        return self._data["uiData"]["HeatSetpoint"]
+        return self._state.setpoint_heat
 
     async def set_setpoint_heat(self, temp) -> None:
         """Async set the target temperature when in heating mode"""
-        lower = self._data["uiData"]["HeatLowerSetptLimit"]
-        upper = self._data["uiData"]["HeatUpperSetptLimit"]        
-        deadband = self._data["uiData"]["Deadband"]
-        coolsp = self._data["uiData"]["CoolSetpoint"]
         # HA sometimes doesn't send the temp, so set to current
         if temp is None:
             temp = self._data["uiData"]["HeatSetpoint"]
             _LOG.error("Didn't receive the temp to set. Setting to current temp.")
-        if temp > upper or temp < lower:
-            raise SomeComfortError(f"Setpoint outside range {lower}-{upper}")
-        data = {"HeatSetpoint": temp}
+        await self.set_setpoints(heat=temp)
 
-        if deadband > 0 and (coolsp - deadband) <= temp:
-            data.update({"CoolSetpoint": temp+deadband})
-        else:
-            data.update({"CoolSetpoint": coolsp})
-            
+    async def set_setpoints(self, heat=None, cool=None) -> None:
+        """Async set the heat and/or cool setpoints in a single request.
+
+        Both values are checked against their limits. When only one is given
+        the other is pushed out by the deadband if needed; when both are given
+        they must already be at least the deadband apart.
+        """
+        if heat is None and cool is None:
+            raise SomeComfortError("No setpoint given")
+        ui_data = self._data["uiData"]
+        deadband = ui_data["Deadband"]
+
+        for which, temp in (("Heat", heat), ("Cool", cool)):
+            if temp is None:
+                continue
+            lower = ui_data[f"{which}LowerSetptLimit"]
+            upper = ui_data[f"{which}UpperSetptLimit"]
+            if temp > upper or temp < lower:
+                raise SomeComfortError(f"Setpoint outside range {lower}-{upper}")
+
+        if heat is None:
+            heat = ui_data["HeatSetpoint"]
+            if deadband > 0 and (heat + deadband) >= cool:
+                heat = cool - deadband
+        elif cool is None:
+            cool = ui_data["CoolSetpoint"]
+            if deadband > 0 and (cool - deadband) <= heat:
+                cool = heat + deadband
+        elif deadband > 0 and cool - heat < deadband:
+            raise SomeComfortError(
+                f"Setpoints {heat}-{cool} are closer than deadband {deadband}"
+            )
+
+        data = {"HeatSetpoint": heat, "CoolSetpoint": cool}
         if not self._get_hold("Heat") and not self._get_hold("Cool"):
             data.update( {
                     "StatusCool": HOLD_TYPES.index("temporary"),
                     "StatusHeat": HOLD_TYPES.index("temporary"),
             })
-        
-        await self._client.set_thermostat_settings(
-            self.deviceid, data
-        )
-        self._data["uiData"]["HeatSetpoint"] = temp
+
+        await self._write_settings(data, "uiData", data)
 
     def _get_hold(self, which) -> bool | datetime.time:
-        try:
-            hold = HOLD_TYPES[self._data["uiData"][f"Status{which}"]]
-        except KeyError as exc:
-            mode = self._data["uiData"][f"Status{which}"]
-            raise APIError(f"Unknown hold mode {mode}") from exc
-        period = self._data["uiData"][f"{which}NextPeriod"]
-        if hold == "schedule":
-            return False
-        if hold == "permanent":
-            return True
+        state = self._state
+        if which == "Heat":
+            hold, status = state.hold_heat, state.hold_heat_status
         else:
-            return _hold_deadline(period)
+            hold, status = state.hold_cool, state.hold_cool_status
+        if hold is None:
+            raise APIError(f"Unknown hold mode {status}")
+        return hold
 
     async def _set_hold(self, which, hold, temperature=None) -> None:
         settings = {}
@@ -267,8 +523,7 @@ class Device(object):
             if which == "Cool" and deadband > 0 and (heatsp + deadband) >= temperature:
                 settings.update({"HeatSetpoint": temperature-deadband})
             settings.update({f"{which}Setpoint": temperature})
-        await self._client.set_thermostat_settings(self.deviceid, settings)
-        self._data["uiData"].update(settings)
+        await self._write_settings(settings, "uiData", settings)
 
     @property
     def hold_heat(self) -> bool:
@@ -291,7 +546,7 @@ class Device(object):
     @property
     def current_temperature(self) -> float:
         """The current measured ambient temperature"""
-        return self._data["uiData"]["DispTemperature"]
+        return self._state.current_temperature
 
     @property
     def has_humidifier(self) -> bool:
@@ -347,144 +602,111 @@ class Device(object):
     @property
     def current_humidity(self) -> float | None:
         """The current measured ambient humidity"""
-        return (
-            self._data["uiData"]["IndoorHumidity"]
-            if self._data["uiData"]["IndoorHumiditySensorAvailable"]
-            and self._data["uiData"]["IndoorHumiditySensorNotFault"]
-            else None
-        )
+        return self._state.current_humidity
 
     @property
     def equipment_output_status(self) -> str:
         """The current equipment output status"""
-        if self._data["uiData"]["EquipmentOutputStatus"] in (0, None):
-            if self.fan_running:
-                return "fan"
-            else:
-                return "off"
-        return EQUIPMENT_OUTPUT_STATUS[self._data["uiData"]["EquipmentOutputStatus"]]
+        return self._state.equipment_output_status
 
     @property
     def outdoor_temperature(self) -> float | None:
         """The current measured outdoor temperature"""
-        if self._data["uiData"]["OutdoorTemperatureAvailable"]:
-            return self._data["uiData"]["OutdoorTemperature"]
-        return None
+        return self._state.outdoor_temperature
 
     @property
     def outdoor_humidity(self) -> float | None:
         """The current measured outdoor humidity"""
-        if self._data["uiData"]["OutdoorHumidityAvailable"]:
-            return self._data["uiData"]["OutdoorHumidity"]
-        return None
+        return self._state.outdoor_humidity
 
     @property
     def temperature_unit(self) -> str:
         """The temperature unit currently in use. Either 'F' or 'C'"""
-        return self._data["uiData"]["DisplayUnits"]
+        return self._state.temperature_unit
 
-    async def set_humidifier_setpoint(self, humidity: int) -> None:
-        """Set humidity settings."""
-        data = self._gdata['Humidifier']
-        data.update({
-            "Setpoint": _humidity_step(humidity),
-            })
+    async def _set_humidity_settings(self, which: str, settings: dict) -> None:
+        """Send Humidifier/Dehumidifier settings and drop the cached GetData."""
+        data = self._gdata[which]
+        data.update(settings)
         _LOG.debug("Sending Data: %s", data)
-        url = f"{self._client._baseurl}/portal/Device/Menu/Humidifier"
-        result = await self._client._post_json(url, json=data)
-        _LOG.debug("Received Humidifier setting response %s", result)
+        url = f"{self._client._baseurl}/portal/Device/Menu/{which}"
+        try:
+            result = await self._client._post_json(
+                url, json=data, priority=PRIORITY_WRITE
+            )
+        finally:
+            self._client.invalidate_data(self.deviceid)
+        _LOG.debug("Received %s setting response %s", which, result)
         if result is None or not result.ok:
             raise APIError("API rejected humidity settings")
-        
+
+    async def set_humidifier_setpoint(self, humidity: int) -> None:
+        """Set humidity settings."""
+        await self._set_humidity_settings(
+            "Humidifier", {"Setpoint": _humidity_step(humidity)}
+        )
+
     async def set_humidifier_auto(self) -> None:
         """Set humidity settings."""
-        data = self._gdata['Humidifier']
-        data.update({"Mode": 1})
-        _LOG.debug("Sending Data: %s", data)
-        url = f"{self._client._baseurl}/portal/Device/Menu/Humidifier"
-        result = await self._client._post_json(url, json=data)
-        _LOG.debug("Received Humidifier setting response %s", result)
-        if result is None or not result.ok:
-            raise APIError("API rejected humidity settings")
+        await self._set_humidity_settings("Humidifier", {"Mode": 1})
 
     async def set_humidifier_off(self) -> None:
         """Set humidity settings."""
-        data = self._gdata['Humidifier']
-        data.update({"Mode": 0})
-        _LOG.debug("Sending Data: %s", data)
-        url = f"{self._client._baseurl}/portal/Device/Menu/Humidifier"
-        result = await self._client._post_json(url, json=data)
-        _LOG.debug("Received Humidifier setting response %s", result)
-        if result is None or not result.ok:
-            raise APIError("API rejected humidity settings")
+        await self._set_humidity_settings("Humidifier", {"Mode": 0})
 
     async def set_dehumidifier_setpoint(self, humidity: int) -> None:
         """Set humidity settings."""
-        data = self._gdata['Dehumidifier']
-        data.update({
-            "Setpoint": _humidity_step(humidity),
-            })
-        _LOG.debug("Sending Data: %s", data)
-        url = f"{self._client._baseurl}/portal/Device/Menu/Dehumidifier"
-        result = await self._client._post_json(url, json=data)
-        _LOG.debug("Received Dehumidifier setting response %s", result)
-        if result is None or not result.ok:
-            raise APIError("API rejected humidity settings")
-        
+        await self._set_humidity_settings(
+            "Dehumidifier", {"Setpoint": _humidity_step(humidity)}
+        )
+
     async def set_dehumidifier_auto(self) -> None:
         """Set humidity settings."""
-        data = self._gdata['Dehumidifier']
-        data.update({"Mode": 1})
-        _LOG.debug("Sending Data: %s", data)
-        url = f"{self._client._baseurl}/portal/Device/Menu/Dehumidifier"
-        result = await self._client._post_json(url, json=data)
-        _LOG.debug("Received Dehumidifier setting response %s", result)
-        if result is None or not result.ok:
-            raise APIError("API rejected humidity settings")
+        await self._set_humidity_settings("Dehumidifier", {"Mode": 1})
 
     async def set_dehumidifier_off(self) -> None:
         """Set humidity settings."""
-        data = self._gdata['Dehumidifier']
-        data.update({"Mode": 0})
-        _LOG.debug("Sending Data: %s", data)
-        url = f"{self._client._baseurl}/portal/Device/Menu/Dehumidifier"
-        result = await self._client._post_json(url, json=data)
-        _LOG.debug("Received Dehumidifier setting response %s", result)
-        if result is None or not result.ok:
-            raise APIError("API rejected humidity settings")
+        await self._set_humidity_settings("Dehumidifier", {"Mode": 0})
 
 
+    def _raw_view(self, name: str, data: Any) -> Mapping:
+        """Return the cached read-only view of data, building it once."""
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = _read_only(data)
+        return view
+
     @property
-    def raw_ui_data(self) -> dict:
+    def raw_ui_data(self) -> Mapping:
         """The raw uiData structure from the API.
 
-        Note that this is read only!
+        A read-only view shared by all readers until the next refresh.
         """
-        return copy.deepcopy(self._data["uiData"])
+        return self._raw_view("uiData", self._data["uiData"])
 
     @property
-    def raw_fan_data(self) -> dict:
+    def raw_fan_data(self) -> Mapping:
         """The raw fanData structure from the API.
 
-        Note that this is read only!
+        A read-only view shared by all readers until the next refresh.
         """
-        return copy.deepcopy(self._data["fanData"])
+        return self._raw_view("fanData", self._data["fanData"])
 
     @property
-    def raw_dr_data(self) -> dict:
+    def raw_dr_data(self) -> Mapping:
         """The raw drData structure from the API.
 
-        Note that this is read only!
+        A read-only view shared by all readers until the next refresh.
         """
-        return copy.deepcopy(self._data["drData"])
-    
+        return self._raw_view("drData", self._data["drData"])
+
     @property
-    def raw_data(self) -> dict:
-        """The raw drData structure from the API.
+    def raw_data(self) -> Mapping:
+        """The raw Menu/GetData structure from the API.
 
-        Note that this is read only!
+        A read-only view shared by all readers until the next refresh.
         """
-        return copy.deepcopy(self._gdata)
-        
+        return self._raw_view("gdata", self._gdata)
+
     def __repr__(self) -> str:
         return f"Device<{self.deviceid}:{self.name}>"
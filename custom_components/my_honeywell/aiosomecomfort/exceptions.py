@@ -12,6 +12,9 @@ class ConnectionError(SomeComfortError):
 class AuthError(SomeComfortError):
     """SomeComfort Authentication Error."""
 
+class InvalidCredentials(AuthError):
+    """Login rejected the username or password."""
+
 class APIError(SomeComfortError):
     """SomeComfort General API error."""
 
@@ -24,6 +27,9 @@ class SessionTimedOut(SomeComfortError):
 class ServiceUnavailable(SomeComfortError):
     """SomeComfort Service Unavailable."""
 
+class CircuitOpen(ServiceUnavailable):
+    """Request not sent because the circuit breaker is open."""
+
 class UnexpectedResponse(SomeComfortError):
     """SomeComfort responded with incorrect type."""
 
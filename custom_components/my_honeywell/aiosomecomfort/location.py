@@ -1,6 +1,9 @@
 from __future__ import annotations
+import asyncio
 from .device import Device
 
+DISCOVERY_CONCURRENCY = 4
+
 
 class Location(object):
     """Location class for Honeywell"""
@@ -11,17 +14,50 @@ class Location(object):
         self._locationid = "unknown"
 
     @classmethod
-    async def from_api_response(cls, client, api_response) -> Location:
-        """Process a response from the API."""
+    async def from_api_response(
+        cls, client, api_response, hydrate: bool = True
+    ) -> Location:
+        """Process a response from the API.
+
+        Devices are built from the location payload alone; with hydrate=True
+        they are then refreshed together, at most DISCOVERY_CONCURRENCY at once.
+        """
         self = cls(client)
         self._locationid = api_response["LocationID"]
         devices = api_response["Devices"]
         _devices = [
-            await Device.from_location_response(client, self, dev) for dev in devices
+            await Device.from_location_response(client, self, dev, hydrate=False)
+            for dev in devices
         ]
         self._devices = {dev.deviceid: dev for dev in _devices}
+        if hydrate:
+            semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+            async def _hydrate(dev: Device) -> None:
+                async with semaphore:
+                    await dev.refresh()
+
+            await asyncio.gather(*(_hydrate(dev) for dev in _devices))
         return self
 
+    @classmethod
+    def from_snapshot(cls, client, snapshot) -> Location:
+        """Rebuild a location and its devices from a snapshot()."""
+        self = cls(client)
+        self._locationid = snapshot["LocationID"]
+        _devices = [
+            Device.from_snapshot(client, self, dev) for dev in snapshot["Devices"]
+        ]
+        self._devices = {dev.deviceid: dev for dev in _devices}
+        return self
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable copy of the location and its devices."""
+        return {
+            "LocationID": self._locationid,
+            "Devices": [dev.snapshot() for dev in self._devices.values()],
+        }
+
     @property
     def devices_by_id(self) -> dict:
         """A dict of devices indexed by DeviceID."""
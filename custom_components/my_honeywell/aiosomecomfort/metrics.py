@@ -0,0 +1,115 @@
+"""Per-endpoint request metrics for AIOSomeComfort."""
+from __future__ import annotations
+import bisect
+import time
+from urllib.parse import urlsplit
+
+# Upper bounds in seconds; the last bucket catches everything slower
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def endpoint_name(method: str, url) -> str:
+    """Name an endpoint by method and last non-numeric path segment.
+
+    e.g. "GET CheckDataSession", "POST GetData", "POST portal" (login).
+    """
+    segments = [
+        segment
+        for segment in urlsplit(str(url)).path.split("/")
+        if segment and not segment.isdigit()
+    ]
+    return f"{method.upper()} {segments[-1] if segments else '/'}"
+
+
+class EndpointMetrics:
+    """Counters for one endpoint."""
+
+    __slots__ = (
+        "requests",
+        "retries",
+        "in_flight",
+        "max_in_flight",
+        "bytes_received",
+        "statuses",
+        "latency_buckets",
+        "latency_total",
+        "latency_max",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.bytes_received = 0
+        self.statuses: dict[int | str, int] = {}
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def as_dict(self) -> dict:
+        """Return a plain copy of the counters."""
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ["inf"]
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "bytes_received": self.bytes_received,
+            "statuses": dict(self.statuses),
+            "latency": {
+                "buckets": dict(zip(bounds, self.latency_buckets)),
+                "mean": self.latency_total / self.requests if self.requests else 0.0,
+                "max": self.latency_max,
+            },
+        }
+
+
+class Metrics:
+    """
+    Request metrics keyed by endpoint.
+
+    The client only calls into this when metrics are enabled; disabled, each
+    request pays a single None check.
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, EndpointMetrics] = {}
+
+    def _get(self, endpoint: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def request_started(self, endpoint: str) -> float:
+        """Count a request as in flight; returns its start time."""
+        metrics = self._get(endpoint)
+        metrics.in_flight += 1
+        metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+        return time.monotonic()
+
+    def request_finished(
+        self, endpoint: str, started: float, status: int | str, nbytes: int
+    ) -> None:
+        """Record a finished request: HTTP status or exception name, body size."""
+        elapsed = time.monotonic() - started
+        metrics = self._get(endpoint)
+        metrics.in_flight -= 1
+        metrics.requests += 1
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+        metrics.bytes_received += nbytes
+        metrics.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        metrics.latency_total += elapsed
+        metrics.latency_max = max(metrics.latency_max, elapsed)
+
+    def retried(self, endpoint: str) -> None:
+        """Count a retry of a request to the endpoint."""
+        self._get(endpoint).retries += 1
+
+    def snapshot(self) -> dict:
+        """Return a copy of every endpoint's counters."""
+        return {
+            endpoint: metrics.as_dict()
+            for endpoint, metrics in self._endpoints.items()
+        }
@@ -0,0 +1,109 @@
+"""Account-wide token bucket limiting the rate of portal requests."""
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable
+
+_LOG = logging.getLogger("somecomfort")
+
+# Lower goes first
+PRIORITY_WRITE = 0
+PRIORITY_POLL = 1
+
+MIN_SLEEP = 0.001  # seconds
+
+
+class TokenBucket:
+    """
+    Hand out request tokens at `rate` per second with bursts up to `burst`.
+
+    Callers that find the bucket empty queue by priority, then arrival
+    order, so a user's write waits behind at most the token it needs rather
+    than behind every queued poll. clock and sleep can be replaced with a
+    virtual clock for tests and benchmarks.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._waiters: list[tuple[int, int, float, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._pump: asyncio.Task | None = None
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Callers currently waiting for a token."""
+        return sum(1 for waiter in self._waiters if not waiter[3].done())
+
+    def stats(self) -> dict:
+        """Counters for diagnostics."""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "total_wait": self.total_wait,
+            "max_wait": self.max_wait,
+        }
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, priority: int = PRIORITY_POLL) -> float:
+        """Wait for a token; return how long the caller waited."""
+        self._refill()
+        self.acquired += 1
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+
+        future = asyncio.get_running_loop().create_future()
+        start = self._clock()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), start, future))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.ensure_future(self._run_pump())
+        waited = await future
+        self.waited += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        if waited > 1:
+            _LOG.debug("Waited %.1fs for a request token", waited)
+        return waited
+
+    async def _run_pump(self) -> None:
+        """Release queued callers as tokens become available."""
+        while self._waiters:
+            self._refill()
+            while self._waiters and self._tokens >= 1:
+                _, _, start, future = heapq.heappop(self._waiters)
+                if future.done():
+                    # Cancelled while waiting
+                    continue
+                self._tokens -= 1
+                future.set_result(self._clock() - start)
+            while self._waiters and self._waiters[0][3].done():
+                heapq.heappop(self._waiters)
+            if self._waiters:
+                # Floor the sleep so float rounding (0.999... tokens) can't spin
+                await self._sleep(max((1 - self._tokens) / self._rate, MIN_SLEEP))
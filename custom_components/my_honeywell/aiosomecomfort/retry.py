@@ -0,0 +1,112 @@
+"""Retry budget shared by every layer working on the same operation."""
+from __future__ import annotations
+import contextlib
+import contextvars
+import logging
+import random
+import time
+from typing import Callable, Iterator
+
+_LOG = logging.getLogger("somecomfort")
+
+_current_budget: contextvars.ContextVar[RetryBudget | None] = contextvars.ContextVar(
+    "somecomfort_retry_budget", default=None
+)
+
+
+class RetryBudget:
+    """
+    Retries and time left for one operation.
+
+    Every request of the operation gets its first attempt (while time is
+    left); only retries draw on the shared allowance of attempts - 1.
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._policy = policy
+        self.attempts = 0
+        self.retries = 0
+        self.deadline = policy.clock() + policy.deadline
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left before the deadline."""
+        return max(0.0, self.deadline - self._policy.clock())
+
+    @property
+    def retries_left(self) -> int:
+        """Retries the operation may still make."""
+        return max(0, self._policy.attempts - 1 - self.retries)
+
+    def start_attempt(self, retry: bool = False) -> bool:
+        """Start an attempt; False if time is up or a retry has none left."""
+        if self.remaining <= 0 or (retry and not self.retries_left):
+            return False
+        self.attempts += 1
+        if retry:
+            self.retries += 1
+        return True
+
+    def backoff(self) -> float | None:
+        """Return the delay before the next retry, or None to give up.
+
+        Full jitter: uniform between zero and the capped exponential delay.
+        Gives up if no retries are left or the delay would pass the deadline.
+        """
+        if not self.retries_left:
+            return None
+        ceiling = min(
+            self._policy.backoff_cap,
+            self._policy.backoff_base * 2 ** self.retries,
+        )
+        delay = random.uniform(0, ceiling)
+        if delay >= self.remaining:
+            return None
+        return delay
+
+
+class RetryPolicy:
+    """
+    How many retries and how long one operation may spend on them.
+
+    attempts is what a lone request gets; an operation of several requests
+    shares the same attempts - 1 retries between them. operation() opens a
+    budget for the current task; any layer that opens one while a budget is
+    already active (a device refresh calling two endpoints, a location
+    listing over several pages, a write going through re-authentication)
+    shares it, so retries at different layers never multiply.
+    """
+
+    def __init__(
+        self,
+        attempts: int,
+        deadline: float,
+        backoff_base: float,
+        backoff_cap: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.attempts = max(1, attempts)
+        self.deadline = deadline
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.clock = clock
+
+    @contextlib.contextmanager
+    def operation(self) -> Iterator[RetryBudget]:
+        """Join the active budget, or start a new one for this operation."""
+        budget = _current_budget.get()
+        if budget is not None:
+            yield budget
+            return
+        budget = RetryBudget(self)
+        token = _current_budget.set(budget)
+        try:
+            yield budget
+        finally:
+            _current_budget.reset(token)
+            if budget.retries:
+                _LOG.debug(
+                    "Operation used %d attempts, %d of them retries",
+                    budget.attempts,
+                    budget.retries,
+                )
@@ -1,7 +1,6 @@
 """Climate platform for My Honeywell integration."""
 from __future__ import annotations
 
-import asyncio
 from datetime import timedelta
 import logging
 from typing import Any
@@ -21,9 +20,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import MyHoneywellEntity
 from .aiosomecomfort import SomeComfortError, APIError
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,8 +57,6 @@ HVAC_ACTION_MAP = {
     "cool": HVACAction.COOLING,
 }
 
-RETRY_ATTEMPTS = 3
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -87,11 +84,11 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class MyHoneywellClimate(CoordinatorEntity, ClimateEntity):
+class MyHoneywellClimate(MyHoneywellEntity, ClimateEntity):
     """Representation of a Honeywell thermostat."""
 
-    _attr_has_entity_name = True
     _attr_name = None
+    _source_sections = frozenset({"status", "uiData", "fanData"})
     _enable_turn_on_off_backwards_compatibility = False
 
     def __init__(
@@ -102,18 +99,11 @@ class MyHoneywellClimate(CoordinatorEntity, ClimateEntity):
         heat_away_temp: int,
     ) -> None:
         """Initialize the thermostat."""
-        super().__init__(coordinator)
-        self._device = device
+        super().__init__(coordinator, device)
         self._cool_away_temp = cool_away_temp
         self._heat_away_temp = heat_away_temp
         
         self._attr_unique_id = f"{device.deviceid}_climate"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device.deviceid)},
-            "name": device.name,
-            "manufacturer": "Honeywell",
-            "model": "Total Connect Comfort",
-        }
 
         # Build supported features
         self._attr_supported_features = (
@@ -138,14 +128,6 @@ class MyHoneywellClimate(CoordinatorEntity, ClimateEntity):
         except (KeyError, TypeError):
             return False
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if self.coordinator.data:
-            device_data = self.coordinator.data.get(self._device.deviceid, {})
-            return device_data.get("available", False)
-        return False
-
     @property
     def temperature_unit(self) -> str:
         """Return the unit of measurement."""
@@ -252,32 +234,24 @@ class MyHoneywellClimate(CoordinatorEntity, ClimateEntity):
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature(s)."""
-        for attempt in range(RETRY_ATTEMPTS):
-            try:
-                if (temp := kwargs.get(ATTR_TEMPERATURE)) is not None:
-                    if self.hvac_mode == HVACMode.COOL:
-                        await self._device.set_setpoint_cool(temp)
-                    else:
-                        await self._device.set_setpoint_heat(temp)
-                
-                if (temp_low := kwargs.get(ATTR_TARGET_TEMP_LOW)) is not None:
-                    await self._device.set_setpoint_heat(temp_low)
-                
-                if (temp_high := kwargs.get(ATTR_TARGET_TEMP_HIGH)) is not None:
-                    await self._device.set_setpoint_cool(temp_high)
-
-                await self.coordinator.async_request_refresh()
-                return
-                
-            except SomeComfortError as ex:
-                _LOGGER.warning(
-                    "Failed to set temperature (attempt %d/%d): %s",
-                    attempt + 1, RETRY_ATTEMPTS, ex
-                )
-                if attempt < RETRY_ATTEMPTS - 1:
-                    await asyncio.sleep(2 ** attempt)
+        # Retries happen once, in the client, under its retry policy
+        try:
+            if (temp := kwargs.get(ATTR_TEMPERATURE)) is not None:
+                if self.hvac_mode == HVACMode.COOL:
+                    await self._device.set_setpoint_cool(temp)
                 else:
-                    _LOGGER.error("Failed to set temperature after %d attempts", RETRY_ATTEMPTS)
+                    await self._device.set_setpoint_heat(temp)
+
+            temp_low = kwargs.get(ATTR_TARGET_TEMP_LOW)
+            temp_high = kwargs.get(ATTR_TARGET_TEMP_HIGH)
+            if temp_low is not None or temp_high is not None:
+                # One request for both ends of the range
+                await self._device.set_setpoints(heat=temp_low, cool=temp_high)
+        except SomeComfortError as ex:
+            _LOGGER.error("Failed to set temperature: %s", ex)
+            return
+
+        self.coordinator.async_device_written(self._device)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode."""
@@ -286,20 +260,13 @@ class MyHoneywellClimate(CoordinatorEntity, ClimateEntity):
             _LOGGER.error("Unsupported HVAC mode: %s", hvac_mode)
             return
 
-        for attempt in range(RETRY_ATTEMPTS):
-            try:
-                await self._device.set_system_mode(honeywell_mode)
-                await self.coordinator.async_request_refresh()
-                return
-            except SomeComfortError as ex:
-                _LOGGER.warning(
-                    "Failed to set HVAC mode (attempt %d/%d): %s",
-                    attempt + 1, RETRY_ATTEMPTS, ex
-                )
-                if attempt < RETRY_ATTEMPTS - 1:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    _LOGGER.error("Failed to set HVAC mode after %d attempts", RETRY_ATTEMPTS)
+        try:
+            await self._device.set_system_mode(honeywell_mode)
+        except SomeComfortError as ex:
+            _LOGGER.error("Failed to set HVAC mode: %s", ex)
+            return
+
+        self.coordinator.async_device_written(self._device)
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new fan mode."""
@@ -314,20 +281,13 @@ class MyHoneywellClimate(CoordinatorEntity, ClimateEntity):
             _LOGGER.error("Unsupported fan mode: %s", fan_mode)
             return
 
-        for attempt in range(RETRY_ATTEMPTS):
-            try:
-                await self._device.set_fan_mode(honeywell_fan)
-                await self.coordinator.async_request_refresh()
-                return
-            except SomeComfortError as ex:
-                _LOGGER.warning(
-                    "Failed to set fan mode (attempt %d/%d): %s",
-                    attempt + 1, RETRY_ATTEMPTS, ex
-                )
-                if attempt < RETRY_ATTEMPTS - 1:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    _LOGGER.error("Failed to set fan mode after %d attempts", RETRY_ATTEMPTS)
+        try:
+            await self._device.set_fan_mode(honeywell_fan)
+        except SomeComfortError as ex:
+            _LOGGER.error("Failed to set fan mode: %s", ex)
+            return
+
+        self.coordinator.async_device_written(self._device)
 
     async def async_turn_on(self) -> None:
         """Turn on the thermostat."""
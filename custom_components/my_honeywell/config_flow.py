@@ -4,7 +4,6 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -13,17 +12,24 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
+    CONF_API_CALLS_PER_HOUR,
     CONF_COOL_AWAY_TEMPERATURE,
     CONF_HEAT_AWAY_TEMPERATURE,
+    CONF_MAX_CONCURRENT_REFRESHES,
+    DEFAULT_API_CALLS_PER_HOUR,
     DEFAULT_COOL_AWAY_TEMPERATURE,
     DEFAULT_HEAT_AWAY_TEMPERATURE,
+    DEFAULT_MAX_CONCURRENT_REFRESHES,
     DOMAIN,
+    MAX_CONCURRENT_REFRESHES_LIMIT,
 )
+from .session import async_create_session
 from .aiosomecomfort import (
     AIOSomeComfort,
     AuthError,
     APIRateLimited,
     ConnectionError as SomeComfortConnectionError,
+    InvalidCredentials,
     SomeComfortError,
 )
 
@@ -61,8 +67,11 @@ class MyHoneywellConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     user_input[CONF_USERNAME],
                     user_input[CONF_PASSWORD],
                 )
-            except AuthError:
+            except InvalidCredentials:
                 errors["base"] = "invalid_auth"
+            except AuthError:
+                # Null cookie or failed verification: the portal is down
+                errors["base"] = "cannot_connect"
             except APIRateLimited:
                 errors["base"] = "rate_limited"
             except SomeComfortConnectionError:
@@ -90,14 +99,14 @@ class MyHoneywellConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _test_credentials(self, username: str, password: str) -> None:
         """Test if the credentials are valid."""
-        async with aiohttp.ClientSession() as session:
+        async with async_create_session(self.hass) as session:
             client = AIOSomeComfort(
                 username=username,
                 password=password,
                 session=session,
             )
             await client.login()
-            await client.discover()
+            await client.discover(hydrate=False)
 
     async def async_step_reauth(
         self, entry_data: dict[str, Any]
@@ -119,7 +128,7 @@ class MyHoneywellConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         entry.data[CONF_USERNAME],
                         user_input[CONF_PASSWORD],
                     )
-                except AuthError:
+                except InvalidCredentials:
                     errors["base"] = "invalid_auth"
                 except SomeComfortError:
                     errors["base"] = "unknown"
@@ -161,6 +170,12 @@ class MyHoneywellOptionsFlow(config_entries.OptionsFlow):
             CONF_HEAT_AWAY_TEMPERATURE,
             self.config_entry.data.get(CONF_HEAT_AWAY_TEMPERATURE, DEFAULT_HEAT_AWAY_TEMPERATURE)
         )
+        max_concurrent = self.config_entry.options.get(
+            CONF_MAX_CONCURRENT_REFRESHES, DEFAULT_MAX_CONCURRENT_REFRESHES
+        )
+        calls_per_hour = self.config_entry.options.get(
+            CONF_API_CALLS_PER_HOUR, DEFAULT_API_CALLS_PER_HOUR
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -168,6 +183,14 @@ class MyHoneywellOptionsFlow(config_entries.OptionsFlow):
                 {
                     vol.Optional(CONF_COOL_AWAY_TEMPERATURE, default=cool_away): int,
                     vol.Optional(CONF_HEAT_AWAY_TEMPERATURE, default=heat_away): int,
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REFRESHES, default=max_concurrent
+                    ): vol.All(
+                        int, vol.Range(min=1, max=MAX_CONCURRENT_REFRESHES_LIMIT)
+                    ),
+                    vol.Optional(
+                        CONF_API_CALLS_PER_HOUR, default=calls_per_hour
+                    ): vol.All(int, vol.Range(min=120)),
                 }
             ),
         )
@@ -6,11 +6,43 @@ DOMAIN = "my_honeywell"
 # Configuration
 CONF_COOL_AWAY_TEMPERATURE = "cool_away_temperature"
 CONF_HEAT_AWAY_TEMPERATURE = "heat_away_temperature"
+CONF_MAX_CONCURRENT_REFRESHES = "max_concurrent_refreshes"
+CONF_API_CALLS_PER_HOUR = "api_calls_per_hour"
 
 # Defaults
 DEFAULT_COOL_AWAY_TEMPERATURE = 88
 DEFAULT_HEAT_AWAY_TEMPERATURE = 61
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
+DEFAULT_MAX_CONCURRENT_REFRESHES = 4
+MAX_CONCURRENT_REFRESHES_LIMIT = 16
+DEFAULT_API_CALLS_PER_HOUR = 3600
+LOCATION_PAGE_CONCURRENCY = 4
+WRITE_COALESCE_WINDOW = 0.5  # seconds
+
+# HTTP connector shared by all entries; keep-alive outlasts the poll
+# interval so refresh cycles reuse connections
+DATA_CONNECTOR = f"{DOMAIN}_connector"
+CONNECTOR_LIMIT_PER_HOST = 20
+CONNECTOR_DNS_CACHE_TTL = 300  # seconds
+CONNECTOR_KEEPALIVE_TIMEOUT = 75  # seconds
+
+# Adaptive polling
+POLL_INTERVAL_ACTIVE = timedelta(seconds=15)
+POLL_INTERVAL_IDLE = timedelta(minutes=2)
+POLL_INTERVAL_OFFLINE = timedelta(minutes=5)
+IDLE_AFTER = timedelta(minutes=10)
+RECENT_WRITE_WINDOW = timedelta(minutes=2)
+
+# Change detection: latestData sections hashed per device, plus "status"
+# (availability) and "gdata" (Menu/GetData)
+DEVICE_SECTIONS = ("uiData", "fanData", "drData")
+
+# Storage
+STORAGE_VERSION = 1
+STORAGE_KEY_SESSION = f"{DOMAIN}.{{entry_id}}.session"
+STORAGE_KEY_SNAPSHOT = f"{DOMAIN}.{{entry_id}}.snapshot"
+SESSION_SAVE_DELAY = 10  # seconds
+SNAPSHOT_SAVE_INTERVAL = 300  # seconds between snapshot writes
 
 # Retry settings
 DEFAULT_RETRY_COUNT = 3
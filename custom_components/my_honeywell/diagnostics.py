@@ -0,0 +1,71 @@
+"""Diagnostics support for My Honeywell integration."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, "title", "unique_id"}
+
+
+def _payload_bytes(payload: Any) -> int:
+    """Size of a payload as the JSON the portal sent."""
+    return len(json.dumps(payload, separators=(",", ":"))) if payload else 0
+
+
+def _device_diagnostics(device) -> dict[str, Any]:
+    """Refresh timing and payload sizes for one device."""
+    return {
+        "name": device.name,
+        "alive": device.is_alive,
+        "hydrated": device.is_hydrated,
+        "last_refresh": (
+            datetime.fromtimestamp(device._last_refresh, timezone.utc).isoformat()
+            if device._last_refresh
+            else None
+        ),
+        "pending_writes": len(device._pending),
+        "payload_bytes": {
+            "latestData": _payload_bytes(device._data),
+            "gdata": _payload_bytes(device._gdata),
+        },
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    client = data["client"]
+    coordinator = data["coordinator"]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "consecutive_errors": coordinator._consecutive_errors,
+            "state_writes_issued": coordinator.state_writes_issued,
+            "state_writes_skipped": coordinator.state_writes_skipped,
+            "health": coordinator.health.values,
+        },
+        "scheduler": coordinator.scheduler.diagnostics(),
+        "client": {
+            "authenticated": client.is_authenticated,
+            "circuit_state": client.circuit_state,
+            "rate_limiter": client.rate_limiter_stats,
+            "data_cache": client.data_cache_stats,
+            "location_page_requests": client.location_page_requests,
+        },
+        "requests": client.metrics_snapshot(),
+        "devices": {
+            device.deviceid: _device_diagnostics(device) for device in data["devices"]
+        },
+    }
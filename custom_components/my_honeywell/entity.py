@@ -0,0 +1,69 @@
+"""Base entity for My Honeywell integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+
+class MyHoneywellEntity(CoordinatorEntity):
+    """Entity bound to one Honeywell device on the coordinator."""
+
+    _attr_has_entity_name = True
+    # Data sections this entity's state is read from; see DEVICE_SECTIONS
+    _source_sections = frozenset({"status", "uiData", "fanData", "drData", "gdata"})
+
+    def __init__(self, coordinator, device) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._device = device
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device.deviceid)},
+            "name": device.name,
+            "manufacturer": "Honeywell",
+            "model": "Total Connect Comfort",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Also listen for refreshes of just this entity's device."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_device_listener(
+                self._device.deviceid, self.async_write_ha_state
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if a section this entity reads from changed."""
+        device_data = (self.coordinator.data or {}).get(self._device.deviceid, {})
+        changed = device_data.get("changed")
+        if (
+            self.coordinator.last_update_success
+            and changed is not None
+            and not changed & self._source_sections
+        ):
+            self.coordinator.state_writes_skipped += 1
+            return
+        self.coordinator.state_writes_issued += 1
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        if self.coordinator.data:
+            device_data = self.coordinator.data.get(self._device.deviceid, {})
+            return device_data.get("available", False)
+        return False
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag state served from the startup snapshot before the first refresh."""
+        if self.coordinator.data:
+            device_data = self.coordinator.data.get(self._device.deviceid, {})
+            if device_data.get("stale"):
+                return {"stale": True}
+        return None
@@ -0,0 +1,114 @@
+"""API health figures for the My Honeywell diagnostic sensors."""
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Any, Callable
+
+from .aiosomecomfort.metrics import LATENCY_BUCKETS
+
+# How far back API calls per hour are measured
+RATE_WINDOW = 3600  # seconds
+
+
+def _totals(snapshot: dict) -> tuple[int, int, list[int], float]:
+    """Sum requests, errors, latency buckets and max latency over all endpoints."""
+    requests = errors = 0
+    buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+    latency_max = 0.0
+    for endpoint in snapshot.values():
+        requests += endpoint["requests"]
+        errors += sum(
+            count
+            for status, count in endpoint["statuses"].items()
+            if not (isinstance(status, int) and 200 <= status < 300)
+        )
+        for index, count in enumerate(endpoint["latency"]["buckets"].values()):
+            buckets[index] += count
+        latency_max = max(latency_max, endpoint["latency"]["max"])
+    return requests, errors, buckets, latency_max
+
+
+class ApiHealth:
+    """
+    Health of the API as seen by one coordinator, updated once per cycle.
+
+    Latency p95 and error rate cover the requests made in the last cycle
+    that made any; they keep their value through cycles without requests.
+    The p95 is the upper bound of the histogram bucket it falls in.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize with no figures."""
+        self._clock = clock
+        self._history: deque[tuple[float, int]] = deque()
+        # Client metrics start from zero, so the first cycle also counts setup
+        self._previous: tuple[int, int, list[int]] = (
+            0,
+            0,
+            [0] * (len(LATENCY_BUCKETS) + 1),
+        )
+        self.values: dict[str, Any] = {
+            "cycle_duration": None,
+            "latency_p95": None,
+            "error_rate": None,
+            "consecutive_errors": 0,
+            "api_calls_per_hour": None,
+            "data_age": None,
+        }
+
+    def record_cycle(
+        self,
+        duration: float,
+        snapshot: dict | None,
+        consecutive_errors: int,
+        devices: list,
+    ) -> None:
+        """Update the figures after a coordinator cycle."""
+        values = self.values
+        values["cycle_duration"] = round(duration, 2)
+        values["consecutive_errors"] = consecutive_errors
+
+        refreshed = [device._last_refresh for device in devices if device._last_refresh]
+        values["data_age"] = (
+            round(time.time() - min(refreshed)) if refreshed else None
+        )
+
+        if snapshot is None:
+            return
+        requests, errors, buckets, latency_max = _totals(snapshot)
+
+        cycle_requests = requests - self._previous[0]
+        if cycle_requests > 0:
+            cycle_errors = errors - self._previous[1]
+            values["error_rate"] = round(100 * cycle_errors / cycle_requests, 1)
+            cycle_buckets = [
+                count - previous for count, previous in zip(buckets, self._previous[2])
+            ]
+            values["latency_p95"] = self._percentile(
+                cycle_buckets, cycle_requests, 0.95, latency_max
+            )
+        self._previous = (requests, errors, buckets)
+
+        now = self._clock()
+        self._history.append((now, requests))
+        while now - self._history[0][0] > RATE_WINDOW:
+            self._history.popleft()
+        start, start_requests = self._history[0]
+        if now > start:
+            values["api_calls_per_hour"] = round(
+                (requests - start_requests) * 3600 / (now - start)
+            )
+
+    @staticmethod
+    def _percentile(
+        buckets: list[int], total: int, fraction: float, latency_max: float
+    ) -> float:
+        """Upper bound of the bucket holding the given fraction of requests."""
+        target = fraction * total
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, buckets):
+            seen += count
+            if seen >= target:
+                return bound
+        return round(latency_max, 2)
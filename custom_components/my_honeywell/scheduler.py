@@ -0,0 +1,160 @@
+"""Adaptive per-device polling for the My Honeywell coordinator."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any, Callable
+
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    IDLE_AFTER,
+    POLL_INTERVAL_ACTIVE,
+    POLL_INTERVAL_IDLE,
+    POLL_INTERVAL_OFFLINE,
+    RECENT_WRITE_WINDOW,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ACTIVE_OUTPUT_STATUSES = ("heat", "cool", "fan")
+
+
+@dataclass
+class DeviceSchedule:
+    """Polling state tracked for one device."""
+
+    interval: float = DEFAULT_SCAN_INTERVAL.total_seconds()
+    last_poll: float | None = None
+    last_change: float | None = None
+    last_write: float | None = None
+    payload: Any = None
+
+
+class PollScheduler:
+    """
+    Decide which devices are due for a refresh on each coordinator tick.
+
+    Each device gets its own interval based on its last known state:
+    - Recently written or actively heating/cooling/fanning: fast
+    - Offline or lost communication: slow
+    - Unchanged for IDLE_AFTER: slow
+    - Anything else: DEFAULT_SCAN_INTERVAL
+
+    If the sum of those intervals would exceed the hourly API-call budget,
+    every interval is stretched by the same factor to fit.
+    """
+
+    def __init__(
+        self,
+        calls_per_hour: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._calls_per_hour = calls_per_hour
+        self._clock = clock
+        self._schedules: dict[str, DeviceSchedule] = {}
+        self._stretch = 1.0
+
+    def _schedule(self, device_id: str) -> DeviceSchedule:
+        return self._schedules.setdefault(device_id, DeviceSchedule())
+
+    @staticmethod
+    def _refresh_cost(device) -> int:
+        """API calls spent by one Device.refresh().
+
+        Menu/GetData is served from the client's cache between refreshes,
+        so only CheckDataSession counts.
+        """
+        return 1
+
+    def _pick_interval(self, device, schedule: DeviceSchedule, now: float) -> float:
+        """Choose the base interval for a device from its state."""
+        if schedule.last_write is not None and (
+            now - schedule.last_write < RECENT_WRITE_WINDOW.total_seconds()
+        ):
+            return POLL_INTERVAL_ACTIVE.total_seconds()
+        if not device.is_alive:
+            return POLL_INTERVAL_OFFLINE.total_seconds()
+        try:
+            if device.equipment_output_status in ACTIVE_OUTPUT_STATUSES:
+                return POLL_INTERVAL_ACTIVE.total_seconds()
+        except (KeyError, TypeError):
+            pass
+        if schedule.last_change is not None and (
+            now - schedule.last_change >= IDLE_AFTER.total_seconds()
+        ):
+            return POLL_INTERVAL_IDLE.total_seconds()
+        return DEFAULT_SCAN_INTERVAL.total_seconds()
+
+    def _update_stretch(self, devices: list) -> None:
+        """Stretch all intervals so projected calls stay within budget."""
+        projected = sum(
+            self._refresh_cost(device) * 3600 / self._schedule(device.deviceid).interval
+            for device in devices
+        )
+        stretch = max(1.0, projected / self._calls_per_hour)
+        if stretch != self._stretch:
+            _LOGGER.debug(
+                "Projected %.0f calls/hour against a budget of %d, stretch %.2f",
+                projected,
+                self._calls_per_hour,
+                stretch,
+            )
+        self._stretch = stretch
+
+    def due_devices(self, devices: list) -> list:
+        """Return the devices that should be refreshed now."""
+        now = self._clock()
+        self._update_stretch(devices)
+        due = []
+        for device in devices:
+            schedule = self._schedule(device.deviceid)
+            if (
+                schedule.last_poll is None
+                or now - schedule.last_poll >= schedule.interval * self._stretch
+            ):
+                due.append(device)
+        return due
+
+    def record_refresh(self, device, success: bool) -> None:
+        """Update a device's schedule after a refresh attempt."""
+        now = self._clock()
+        schedule = self._schedule(device.deviceid)
+        schedule.last_poll = now
+        if not success:
+            schedule.interval = DEFAULT_SCAN_INTERVAL.total_seconds()
+            return
+        if schedule.last_change is None or device._data != schedule.payload:
+            schedule.last_change = now
+        schedule.payload = device._data
+        schedule.interval = self._pick_interval(device, schedule, now)
+
+    def note_write(self, device_id: str) -> None:
+        """Mark a device as written by the user so it is polled fast and now."""
+        schedule = self._schedule(device_id)
+        schedule.last_write = self._clock()
+        schedule.interval = POLL_INTERVAL_ACTIVE.total_seconds()
+        schedule.last_poll = None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the scheduler state, with times as seconds ago."""
+        now = self._clock()
+
+        def ago(timestamp: float | None) -> float | None:
+            return None if timestamp is None else round(now - timestamp, 1)
+
+        return {
+            "calls_per_hour": self._calls_per_hour,
+            "stretch": self._stretch,
+            "devices": {
+                device_id: {
+                    "interval": schedule.interval,
+                    "effective_interval": schedule.interval * self._stretch,
+                    "last_poll_ago": ago(schedule.last_poll),
+                    "last_change_ago": ago(schedule.last_change),
+                    "last_write_ago": ago(schedule.last_write),
+                }
+                for device_id, schedule in self._schedules.items()
+            },
+        }
@@ -2,23 +2,72 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import MyHoneywellEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# API health sensors, one set per config entry; keys index coordinator.health
+DIAGNOSTIC_SENSORS = (
+    SensorEntityDescription(
+        key="cycle_duration",
+        name="Last cycle duration",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+    ),
+    SensorEntityDescription(
+        key="latency_p95",
+        name="Request latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+    ),
+    SensorEntityDescription(
+        key="error_rate",
+        name="API error rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    SensorEntityDescription(
+        key="consecutive_errors",
+        name="Consecutive errors",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="api_calls_per_hour",
+        name="API calls per hour",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="calls/h",
+    ),
+    SensorEntityDescription(
+        key="data_age",
+        name="Data age",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -49,35 +98,23 @@ async def async_setup_entry(
             entities.append(
                 MyHoneywellHumiditySensor(coordinator, device, "outdoor")
             )
-    
+
+    entities.extend(
+        MyHoneywellDiagnosticSensor(coordinator, description)
+        for description in DIAGNOSTIC_SENSORS
+    )
     async_add_entities(entities)
 
 
-class MyHoneywellSensorBase(CoordinatorEntity, SensorEntity):
+class MyHoneywellSensorBase(MyHoneywellEntity, SensorEntity):
     """Base class for Honeywell sensors."""
 
-    _attr_has_entity_name = True
+    _source_sections = frozenset({"status", "uiData"})
 
     def __init__(self, coordinator, device, sensor_type: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device = device
+        super().__init__(coordinator, device)
         self._sensor_type = sensor_type
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device.deviceid)},
-            "name": device.name,
-            "manufacturer": "Honeywell",
-            "model": "Total Connect Comfort",
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if self.coordinator.data:
-            device_data = self.coordinator.data.get(self._device.deviceid, {})
-            return device_data.get("available", False)
-        return False
 
 
 class MyHoneywellTemperatureSensor(MyHoneywellSensorBase):
@@ -127,3 +164,45 @@ class MyHoneywellHumiditySensor(MyHoneywellSensorBase):
         if self._sensor_type == "outdoor":
             return self._device.outdoor_humidity
         return self._device.current_humidity
+
+
+class MyHoneywellDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """API health figure for the config entry, from coordinator.health."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator, description: SensorEntityDescription) -> None:
+        """Initialize the diagnostic sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._health_key = description.key
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_{description.key}"
+        # Figures belong to the config entry, shown as a service device
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.entry.entry_id)},
+            "name": coordinator.entry.title,
+            "manufacturer": "Honeywell",
+            "model": "Total Connect Comfort",
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+        self._written_value = None
+
+    @property
+    def available(self) -> bool:
+        """Health figures are available even while the portal is not."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the figure."""
+        return self.coordinator.health.values.get(self._health_key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the figure changed."""
+        value = self.native_value
+        if value == self._written_value:
+            return
+        self._written_value = value
+        self.async_write_ha_state()
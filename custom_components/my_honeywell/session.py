@@ -0,0 +1,58 @@
+"""HTTP sessions for talking to the TCC portal."""
+from __future__ import annotations
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    CONNECTOR_DNS_CACHE_TTL,
+    CONNECTOR_KEEPALIVE_TIMEOUT,
+    CONNECTOR_LIMIT_PER_HOST,
+    DATA_CONNECTOR,
+)
+
+
+@callback
+def async_get_connector(hass: HomeAssistant) -> aiohttp.TCPConnector:
+    """
+    Return the connector shared by every config entry and the config flow.
+
+    async_create_clientsession() always uses Home Assistant's own connector,
+    so this keeps a separate one tuned for polling a single host. It caches
+    DNS and keeps connections alive between poll cycles.
+    """
+    connector = hass.data.get(DATA_CONNECTOR)
+    if connector is not None and not connector.closed:
+        return connector
+
+    connector = aiohttp.TCPConnector(
+        limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+        ttl_dns_cache=CONNECTOR_DNS_CACHE_TTL,
+        keepalive_timeout=CONNECTOR_KEEPALIVE_TIMEOUT,
+        ssl=ssl_util.get_default_context(),
+    )
+    hass.data[DATA_CONNECTOR] = connector
+
+    async def _async_close_connector(event: Event) -> None:
+        await connector.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_connector)
+    return connector
+
+
+@callback
+def async_create_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """
+    Return a session on the shared connector with its own cookie jar.
+
+    Each account keeps its auth cookie in its own jar. Closing the session
+    leaves the shared connector open.
+    """
+    return aiohttp.ClientSession(
+        connector=async_get_connector(hass),
+        connector_owner=False,
+        cookie_jar=aiohttp.CookieJar(),
+    )
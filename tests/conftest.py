@@ -0,0 +1,7 @@
+"""Make the vendored client and the fake TCC server importable in tests."""
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components" / "my_honeywell"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
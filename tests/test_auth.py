@@ -0,0 +1,86 @@
+"""Tests for the single shared re-login after sessions expire."""
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+
+from aiosomecomfort import AIOSomeComfort, AuthError
+
+from fake_tcc import PROFILES, FakeTCCServer
+
+DEVICES = 8
+
+
+async def start(server: FakeTCCServer, session: aiohttp.ClientSession) -> AIOSomeComfort:
+    """Return a logged-in client with every device discovered and refreshed."""
+    client = AIOSomeComfort(
+        "test",
+        "test",
+        session=session,
+        request_rate=1e6,
+        request_burst=1_000_000,
+        baseurl=server.url,
+    )
+    client.retry_policy.backoff_base = 0
+    await client.login()
+    await client.discover()
+    return client
+
+
+def devices(client: AIOSomeComfort) -> list:
+    return [
+        device
+        for location in client.locations_by_id.values()
+        for device in location.devices_by_id.values()
+    ]
+
+
+def test_concurrent_401s_log_in_once():
+    """Every device rejected at once still costs a single login."""
+
+    async def run() -> None:
+        server = FakeTCCServer(devices=DEVICES)
+        await server.start()
+        try:
+            async with aiohttp.ClientSession(
+                cookie_jar=aiohttp.CookieJar(unsafe=True)
+            ) as session:
+                client = await start(server, session)
+                logins = server.logins
+                server.expire_sessions()
+
+                await asyncio.gather(*(device.refresh() for device in devices(client)))
+                assert server.logins - logins == 1
+                assert client.is_authenticated
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_failed_login_is_shared_by_every_waiter():
+    """A failed re-login is attempted once and every waiter gets its error."""
+
+    async def run() -> None:
+        server = FakeTCCServer(devices=DEVICES)
+        await server.start()
+        try:
+            async with aiohttp.ClientSession(
+                cookie_jar=aiohttp.CookieJar(unsafe=True)
+            ) as session:
+                client = await start(server, session)
+                logins = server.logins
+                server.inject(PROFILES["null-cookie"])
+
+                results = await asyncio.gather(
+                    *(device.refresh() for device in devices(client)),
+                    return_exceptions=True,
+                )
+                assert server.logins - logins == 1
+                assert all(isinstance(result, AuthError) for result in results)
+                assert len({id(result) for result in results}) == 1
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
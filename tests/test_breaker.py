@@ -0,0 +1,96 @@
+"""Tests for the circuit breaker and the requests sent through it."""
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from aiosomecomfort import (
+    BREAKER_MIN_CALLS,
+    AIOSomeComfort,
+    CircuitOpen,
+    ConnectionError,
+)
+from aiosomecomfort.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+from fake_tcc import FakeTCCServer, FaultProfile
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        failure_ratio=0.5, min_calls=2, window=60, open_time=30, clock=clock
+    )
+
+
+def test_outcome_from_before_opening_is_not_the_probe():
+    """A request admitted while closed can't close or reopen a half-open breaker."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    slow = breaker.allow()
+    for _ in range(2):
+        breaker.record(breaker.allow(), success=False)
+    assert breaker.state == OPEN
+
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+    probe = breaker.allow()
+    breaker.record(slow, success=True)
+    assert breaker.state == HALF_OPEN
+    assert breaker.is_open
+
+    breaker.record(probe, success=True)
+    assert breaker.state == CLOSED
+
+
+def test_stale_abandon_keeps_the_probe_claimed():
+    """Cancelling an old request doesn't let a second probe through."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    old = breaker.allow()
+    for _ in range(2):
+        breaker.record(breaker.allow(), success=False)
+    clock.now += 30
+    breaker.allow()
+    breaker.abandon(old)
+    with pytest.raises(CircuitOpen):
+        breaker.allow()
+
+
+def test_login_fails_fast_while_open():
+    """Once login failures open the breaker, login sends nothing."""
+
+    async def run() -> None:
+        server = FakeTCCServer()
+        await server.start()
+        try:
+            async with aiohttp.ClientSession(
+                cookie_jar=aiohttp.CookieJar(unsafe=True)
+            ) as session:
+                client = AIOSomeComfort(
+                    "test", "test", session=session, baseurl=server.url
+                )
+                server.inject(FaultProfile("down", duration=60, error_rate=1.0))
+                for _ in range(BREAKER_MIN_CALLS):
+                    with pytest.raises(ConnectionError):
+                        await client.login()
+                assert client.circuit_open
+
+                requests = server.requests
+                with pytest.raises(CircuitOpen):
+                    await client.login()
+                assert server.requests == requests
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
@@ -0,0 +1,95 @@
+"""Tests for Device writes against the fake TCC server."""
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from aiosomecomfort import AIOSomeComfort, ServiceUnavailable
+
+from fake_tcc import FakeTCCServer, FaultProfile
+
+
+def test_failed_coalesced_burst_rolls_back_to_server_value():
+    """Writes that failed together leave nothing pending over later polls."""
+
+    async def run() -> None:
+        server = FakeTCCServer(devices=1)
+        await server.start()
+        try:
+            async with aiohttp.ClientSession(
+                cookie_jar=aiohttp.CookieJar(unsafe=True)
+            ) as session:
+                client = AIOSomeComfort(
+                    "test",
+                    "test",
+                    session=session,
+                    write_coalesce_window=0.05,
+                    baseurl=server.url,
+                )
+                client.retry_policy.backoff_base = 0
+                await client.login()
+                await client.discover()
+                device = client.default_device
+                ui_data = server._devices[device.deviceid]["latestData"]["uiData"]
+                ui_data["HeatSetpoint"] = 68
+                await device.refresh()
+
+                server.inject(FaultProfile("down", duration=60, error_rate=1.0))
+                results = await asyncio.gather(
+                    device.set_setpoint_heat(69),
+                    device.set_setpoint_heat(70),
+                    device.set_setpoint_heat(71),
+                    return_exceptions=True,
+                )
+                assert all(isinstance(result, ServiceUnavailable) for result in results)
+                assert device.setpoint_heat == 68
+                assert device._pending == {}
+
+                server.inject(None)
+                ui_data["HeatSetpoint"] = 67
+                await device.refresh()
+                assert device.setpoint_heat == 67
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_failed_write_keeps_earlier_accepted_write():
+    """A failed write falls back to an accepted one still awaiting a poll."""
+
+    async def run() -> None:
+        server = FakeTCCServer(devices=1)
+        await server.start()
+        try:
+            async with aiohttp.ClientSession(
+                cookie_jar=aiohttp.CookieJar(unsafe=True)
+            ) as session:
+                client = AIOSomeComfort(
+                    "test", "test", session=session, baseurl=server.url
+                )
+                client.retry_policy.backoff_base = 0
+                await client.login()
+                await client.discover()
+                device = client.default_device
+                ui_data = server._devices[device.deviceid]["latestData"]["uiData"]
+                ui_data["HeatSetpoint"] = 68
+                await device.refresh()
+
+                await device.set_setpoint_heat(66)
+                server.inject(FaultProfile("down", duration=60, error_rate=1.0))
+                with pytest.raises(ServiceUnavailable):
+                    await device.set_setpoint_heat(64)
+                server.inject(None)
+                assert device.setpoint_heat == 66
+
+                # The portal hasn't applied 66 yet; the poll must not undo it
+                ui_data["HeatSetpoint"] = 68
+                await device.refresh()
+                assert device.setpoint_heat == 66
+        finally:
+            await server.stop()
+
+    asyncio.run(run())